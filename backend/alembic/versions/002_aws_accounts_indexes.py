@@ -0,0 +1,33 @@
+"""Indexes for aws_accounts listings
+
+Revision ID: 002
+Revises: 001
+Create Date: 2024-01-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # list_accounts orders by account_name; without an index this is a
+    # Seq Scan + Sort on every admin listing
+    op.create_index(
+        'idx_aws_accounts_account_name', 'aws_accounts', ['account_name']
+    )
+    # Composite index for listings filtered to enabled accounts
+    op.create_index(
+        'idx_aws_accounts_enabled_name', 'aws_accounts', ['enabled', 'account_name']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_aws_accounts_enabled_name')
+    op.drop_index('idx_aws_accounts_account_name')
@@ -0,0 +1,135 @@
+"""Partition audit_logs by month and use BRIN on created_at
+
+Revision ID: 003
+Revises: 002
+Create Date: 2024-01-16 00:00:00.000000
+
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Months of future partitions to create beyond the migration run date;
+# the runtime partition roller takes over from there
+_HORIZON_MONTHS = 3
+
+
+def _next_month(year: int, month: int) -> tuple[int, int]:
+    return (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def upgrade() -> None:
+    # audit_logs is append-only and time-ordered: a range-partitioned table
+    # keeps the INSERT path on a small hot partition and turns retention
+    # cleanup into DROP PARTITION instead of DELETE + vacuum. The primary
+    # key must include the partition key, so it becomes (id, created_at).
+    op.execute(
+        """
+        CREATE TABLE audit_logs_new (
+            id UUID NOT NULL,
+            user_id UUID REFERENCES users(id),
+            action VARCHAR(100) NOT NULL,
+            resource_type VARCHAR(50) NOT NULL,
+            resource_id VARCHAR(255) NOT NULL,
+            aws_account_id VARCHAR(12),
+            region VARCHAR(50),
+            request_data JSONB,
+            response_data JSONB,
+            status VARCHAR(20) NOT NULL,
+            ip_address INET,
+            user_agent TEXT,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+
+    # Monthly partitions relative to the migration run date, spanning
+    # every existing row through a few months of headroom, plus a
+    # default catch-all. Anchoring the range on the run date (not a
+    # hardcoded year) matters: rows that land in the default partition
+    # permanently block CREATE PARTITION for their month.
+    bounds = op.get_bind().execute(
+        sa.text("SELECT min(created_at), max(created_at) FROM audit_logs")
+    ).one()
+    now = datetime.now(timezone.utc)
+
+    first = (now.year, now.month)
+    if bounds[0] is not None:
+        first = min(first, (bounds[0].year, bounds[0].month))
+
+    last = (now.year, now.month)
+    for _ in range(_HORIZON_MONTHS):
+        last = _next_month(*last)
+    if bounds[1] is not None:
+        last = max(last, (bounds[1].year, bounds[1].month))
+
+    year, month = first
+    while (year, month) <= last:
+        next_year, next_month = _next_month(year, month)
+        op.execute(
+            f"""
+            CREATE TABLE audit_logs_y{year}m{month:02d}
+            PARTITION OF audit_logs_new
+            FOR VALUES FROM ('{year}-{month:02d}-01') TO ('{next_year}-{next_month:02d}-01')
+            """
+        )
+        year, month = next_year, next_month
+    op.execute(
+        "CREATE TABLE audit_logs_default PARTITION OF audit_logs_new DEFAULT"
+    )
+
+    # Copy existing rows and swap names
+    op.execute("INSERT INTO audit_logs_new SELECT * FROM audit_logs")
+    op.execute("DROP TABLE audit_logs")
+    op.execute("ALTER TABLE audit_logs_new RENAME TO audit_logs")
+
+    # Recreate indexes; BRIN fits time-ordered data far better than B-tree
+    op.create_index('idx_audit_logs_user_id', 'audit_logs', ['user_id'])
+    op.create_index(
+        'idx_audit_logs_resource', 'audit_logs', ['resource_type', 'resource_id']
+    )
+    op.execute(
+        """
+        CREATE INDEX idx_audit_logs_created_at ON audit_logs
+        USING BRIN (created_at) WITH (pages_per_range = 32)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_new")
+    op.execute(
+        """
+        CREATE TABLE audit_logs (
+            id UUID NOT NULL PRIMARY KEY,
+            user_id UUID REFERENCES users(id),
+            action VARCHAR(100) NOT NULL,
+            resource_type VARCHAR(50) NOT NULL,
+            resource_id VARCHAR(255) NOT NULL,
+            aws_account_id VARCHAR(12),
+            region VARCHAR(50),
+            request_data JSONB,
+            response_data JSONB,
+            status VARCHAR(20) NOT NULL,
+            ip_address INET,
+            user_agent TEXT,
+            created_at TIMESTAMPTZ DEFAULT now()
+        )
+        """
+    )
+    op.execute("INSERT INTO audit_logs SELECT * FROM audit_logs_new")
+    op.execute("DROP TABLE audit_logs_new")
+    op.create_index('idx_audit_logs_user_id', 'audit_logs', ['user_id'])
+    op.create_index('idx_audit_logs_created_at', 'audit_logs', ['created_at'])
+    op.create_index(
+        'idx_audit_logs_resource', 'audit_logs', ['resource_type', 'resource_id']
+    )
@@ -0,0 +1,36 @@
+"""lz4 toast compression for audit payload columns
+
+Revision ID: 004
+Revises: 003
+Create Date: 2024-01-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # lz4 toast compression (PG14+) is much faster than pglz on write and
+    # shrinks WAL volume for the large JSON payloads logged per action.
+    op.execute(
+        "ALTER TABLE audit_logs ALTER COLUMN request_data SET COMPRESSION lz4"
+    )
+    op.execute(
+        "ALTER TABLE audit_logs ALTER COLUMN response_data SET COMPRESSION lz4"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE audit_logs ALTER COLUMN request_data SET COMPRESSION pglz"
+    )
+    op.execute(
+        "ALTER TABLE audit_logs ALTER COLUMN response_data SET COMPRESSION pglz"
+    )
@@ -0,0 +1,31 @@
+"""Composite index for audit log keyset pagination
+
+Revision ID: 005
+Revises: 004
+Create Date: 2024-01-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keyset pagination orders by (created_at DESC, id DESC) and seeks
+    # on the same pair; this index makes every page an index range scan
+    op.create_index(
+        'idx_audit_logs_created_id',
+        'audit_logs',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_audit_logs_created_id')
@@ -0,0 +1,42 @@
+"""Indexes for audit log list filters
+
+Revision ID: 006
+Revises: 005
+Create Date: 2024-01-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Covers the common admin filter combo: type + status, newest first.
+    # (A BRIN on created_at already exists from the partitioning
+    # migration for pure time-range scans.)
+    op.create_index(
+        'idx_audit_logs_rt_status_created',
+        'audit_logs',
+        ['resource_type', 'status', sa.text('created_at DESC')],
+    )
+    # pg_trgm makes the action ILIKE '%x%' filter indexable
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'idx_audit_logs_action_trgm',
+        'audit_logs',
+        ['action'],
+        postgresql_using='gin',
+        postgresql_ops={'action': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_audit_logs_action_trgm')
+    op.drop_index('idx_audit_logs_rt_status_created')
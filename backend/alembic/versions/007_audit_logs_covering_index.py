@@ -0,0 +1,43 @@
+"""Covering index for the audit list scan
+
+Revision ID: 007
+Revises: 006
+Create Date: 2024-01-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The list endpoint always orders by created_at DESC and filters on
+    # action/resource_type/status; INCLUDE-ing those lets Postgres
+    # evaluate the filters from the index entries (index-only scan of
+    # the range) instead of heap-fetching every candidate row
+    op.create_index(
+        'idx_audit_logs_created_covering',
+        'audit_logs',
+        [sa.text('created_at DESC')],
+        postgresql_include=['action', 'resource_type', 'status', 'user_id'],
+    )
+    # Failures are the rarest and most-queried status; a partial index
+    # keeps that filter path tiny
+    op.create_index(
+        'idx_audit_logs_failed_created',
+        'audit_logs',
+        [sa.text('created_at DESC')],
+        postgresql_where=sa.text("status = 'failed'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_audit_logs_failed_created')
+    op.drop_index('idx_audit_logs_created_covering')
@@ -0,0 +1,39 @@
+"""Indexes for per-resource and per-user audit lookups
+
+Revision ID: 008
+Revises: 007
+Create Date: 2024-01-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # get_recent_actions filters by resource_id and get_user_actions by
+    # user_id, both ordered newest-first; these compound indexes turn
+    # each into a backward index range scan instead of a sort of the
+    # whole filtered set
+    op.create_index(
+        'idx_audit_logs_resource_created',
+        'audit_logs',
+        ['resource_id', sa.text('created_at DESC')],
+    )
+    op.create_index(
+        'idx_audit_logs_user_created',
+        'audit_logs',
+        ['user_id', sa.text('created_at DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_audit_logs_user_created')
+    op.drop_index('idx_audit_logs_resource_created')
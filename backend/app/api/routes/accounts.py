@@ -4,17 +4,26 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy import select
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.dependencies import RequireAdmin
+from app.dependencies import RequireAdmin, get_audit_service
 from app.models.database import AWSAccount
 from app.models.schemas import AWSAccountCreate, AWSAccountResponse
+from app.query_helpers import select_with_raiseload
 from app.services.audit import AuditService
+from app.services.aws.base import AWSBaseService
 
 router = APIRouter()
 
+# Compiled once; serializing through the adapter skips FastAPI's per-row
+# response validation pass on the list endpoint
+_ACCOUNT_LIST_ADAPTER = TypeAdapter(list[AWSAccountResponse])
+
 
 @router.get("", response_model=list[AWSAccountResponse])
 async def list_accounts(
@@ -22,9 +31,23 @@ async def list_accounts(
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """List configured AWS accounts (admin only)."""
-    query = select(AWSAccount).order_by(AWSAccount.account_name)
+    query = select_with_raiseload(AWSAccount).order_by(AWSAccount.account_name)
     result = await db.execute(query)
-    return result.scalars().all()
+    # Rows come straight from the ORM and already conform to the schema;
+    # model_construct skips validation and orjson serializes in C
+    accounts = [
+        AWSAccountResponse.model_construct(
+            id=row.id,
+            account_id=row.account_id,
+            account_name=row.account_name,
+            role_arn=row.role_arn,
+            external_id=row.external_id,
+            enabled=row.enabled,
+            created_at=row.created_at,
+        )
+        for row in result.scalars().all()
+    ]
+    return ORJSONResponse(_ACCOUNT_LIST_ADAPTER.dump_python(accounts, mode="json"))
 
 
 @router.post("", response_model=AWSAccountResponse, status_code=status.HTTP_201_CREATED)
@@ -33,27 +56,30 @@ async def create_account(
     user: RequireAdmin,
     db: Annotated[AsyncSession, Depends(get_db)],
     http_request: Request,
+    audit: Annotated[AuditService, Depends(get_audit_service)],
 ):
     """Add a new AWS account (admin only)."""
-    audit = AuditService()
 
-    # Check if account already exists
-    existing = await db.execute(
-        select(AWSAccount).where(AWSAccount.account_id == account.account_id)
+    # Single-statement insert; ON CONFLICT replaces the racy exists-check
+    stmt = (
+        pg_insert(AWSAccount)
+        .values(**account.model_dump())
+        .on_conflict_do_nothing(index_elements=["account_id"])
+        .returning(AWSAccount)
     )
-    if existing.scalar_one_or_none():
+    result = await db.execute(stmt)
+    db_account = result.scalar_one_or_none()
+
+    if not db_account:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Account {account.account_id} already exists",
         )
 
-    db_account = AWSAccount(**account.model_dump())
-    db.add(db_account)
     await db.commit()
-    await db.refresh(db_account)
 
     # Log account creation
-    await audit.log_action(
+    audit.enqueue_action(
         user=user,
         action="account:create",
         resource_type="aws_account",
@@ -97,32 +123,50 @@ async def update_account(
     user: RequireAdmin,
     db: Annotated[AsyncSession, Depends(get_db)],
     http_request: Request,
+    audit: Annotated[AuditService, Depends(get_audit_service)],
 ):
     """Update AWS account (admin only)."""
-    audit = AuditService()
 
-    query = select(AWSAccount).where(AWSAccount.id == account_id)
-    result = await db.execute(query)
-    account = result.scalar_one_or_none()
+    # Narrow column fetch for the audit before-values (no ORM entity load)
+    before_row = (
+        await db.execute(
+            select(
+                AWSAccount.account_id,
+                AWSAccount.account_name,
+                AWSAccount.role_arn,
+            ).where(AWSAccount.id == account_id)
+        )
+    ).one_or_none()
 
-    if not account:
+    if not before_row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Account not found",
         )
 
-    # Capture before values for audit
     before_values = {
-        "account_id": account.account_id,
-        "account_name": account.account_name,
-        "role_arn": account.role_arn,
+        "account_id": before_row.account_id,
+        "account_name": before_row.account_name,
+        "role_arn": before_row.role_arn,
     }
 
-    for key, value in account_update.model_dump().items():
-        setattr(account, key, value)
+    # Single-statement update; RETURNING replaces the post-commit refresh
+    stmt = (
+        update(AWSAccount)
+        .where(AWSAccount.id == account_id)
+        .values(**account_update.model_dump())
+        .returning(AWSAccount)
+    )
+    result = await db.execute(stmt.execution_options(synchronize_session=False))
+    account = result.scalar_one_or_none()
+
+    if not account:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Account not found",
+        )
 
     await db.commit()
-    await db.refresh(account)
 
     # Capture after values for audit
     after_values = {
@@ -132,7 +176,7 @@ async def update_account(
     }
 
     # Log account update with before/after values
-    await audit.log_action(
+    audit.enqueue_action(
         user=user,
         action="account:update",
         resource_type="aws_account",
@@ -151,32 +195,39 @@ async def delete_account(
     user: RequireAdmin,
     db: Annotated[AsyncSession, Depends(get_db)],
     http_request: Request,
+    audit: Annotated[AuditService, Depends(get_audit_service)],
 ):
     """Delete AWS account (admin only)."""
-    audit = AuditService()
 
-    query = select(AWSAccount).where(AWSAccount.id == account_id)
-    result = await db.execute(query)
-    account = result.scalar_one_or_none()
+    # Single-statement delete; RETURNING captures the row for audit
+    stmt = (
+        delete(AWSAccount)
+        .where(AWSAccount.id == account_id)
+        .returning(
+            AWSAccount.account_id,
+            AWSAccount.account_name,
+            AWSAccount.role_arn,
+        )
+    )
+    result = await db.execute(stmt.execution_options(synchronize_session=False))
+    deleted_row = result.one_or_none()
 
-    if not account:
+    if not deleted_row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Account not found",
         )
 
-    # Capture account details before deletion for audit
     deleted_account_data = {
-        "account_id": account.account_id,
-        "account_name": account.account_name,
-        "role_arn": account.role_arn,
+        "account_id": deleted_row.account_id,
+        "account_name": deleted_row.account_name,
+        "role_arn": deleted_row.role_arn,
     }
 
-    await db.delete(account)
     await db.commit()
 
     # Log account deletion
-    await audit.log_action(
+    audit.enqueue_action(
         user=user,
         action="account:delete",
         resource_type="aws_account",
@@ -193,9 +244,9 @@ async def verify_account(
     user: RequireAdmin,
     db: Annotated[AsyncSession, Depends(get_db)],
     http_request: Request,
+    audit: Annotated[AuditService, Depends(get_audit_service)],
 ):
     """Verify AWS account access by testing AssumeRole (admin only)."""
-    audit = AuditService()
 
     query = select(AWSAccount).where(AWSAccount.id == account_id)
     result = await db.execute(query)
@@ -207,9 +258,13 @@ async def verify_account(
             detail="Account not found",
         )
 
-    # Test AssumeRole
-    from app.services.aws.base import AWSBaseService
+    # Built once; shared by the success and failure audit branches
+    request_data = {
+        "account_id": account.account_id,
+        "role_arn": account.role_arn,
+    }
 
+    # Test AssumeRole
     try:
         aws_service = AWSBaseService()
         await aws_service.verify_role_access(
@@ -218,34 +273,28 @@ async def verify_account(
         )
 
         # Log successful verification
-        await audit.log_action(
+        audit.enqueue_action(
             user=user,
             action="account:verify",
             resource_type="aws_account",
             resource_ids=[account.account_id],
             request=http_request,
             status="success",
-            request_data={
-                "account_id": account.account_id,
-                "role_arn": account.role_arn,
-            },
+            request_data=request_data,
         )
 
         return {"status": "verified", "message": "Successfully assumed role"}
     except Exception as e:
         # Log failed verification
-        await audit.log_action(
+        audit.enqueue_action(
             user=user,
             action="account:verify",
             resource_type="aws_account",
             resource_ids=[account.account_id],
             request=http_request,
             status="failed",
-            request_data={
-                "account_id": account.account_id,
-                "role_arn": account.role_arn,
-            },
-            response_data={"error": str(e), "error_type": type(e).__name__},
+            request_data=request_data,
+            response_data={"exc": e},
         )
 
         raise HTTPException(
@@ -1,10 +1,22 @@
 """Resource action endpoints with safety controls."""
 
-from typing import Annotated
+from typing import Annotated, Any, Awaitable, Callable, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
-
-from app.dependencies import RequireAdmin, RequireOperator, get_cache_service
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+
+from app.dependencies import (
+    RequireAdmin,
+    RequireOperator,
+    get_audit_service,
+    get_cache_service,
+    get_ec2_service,
+    get_ecs_service,
+    get_rds_service,
+    get_s3_service,
+    get_safety_service,
+)
 from app.cache import CacheService
 from app.models.schemas import (
     ActionResponse,
@@ -17,11 +29,128 @@ from app.services.aws.ec2 import EC2Service
 from app.services.aws.rds import RDSService
 from app.services.aws.ecs import ECSService
 from app.services.aws.s3 import S3Service
+from app.services.aws.aggregator import invalidate_fetch_cache
 from app.services.audit import AuditService
 from app.services.safety import SafetyService
+from app.models.database import User
 
 router = APIRouter()
 
+# Module-level adapters reuse the compiled pydantic-core serializers instead
+# of re-walking the schema on every request.model_dump() call
+_EC2_DUMPER = TypeAdapter(EC2ActionRequest)
+_RDS_DUMPER = TypeAdapter(RDSActionRequest)
+_ECS_DUMPER = TypeAdapter(ECSScaleRequest)
+_ACTION_RESPONSE_DUMPER = TypeAdapter(ActionResponse)
+
+
+def _should_remote_check(dry_run: bool, override_code: Optional[str] = None) -> bool:
+    """Whether a request needs the remote safety probe and AWS call.
+
+    A dry run without an override code can be answered locally: the IDs
+    are already schema-validated and nothing changes state, so the tag
+    lookup and the DryRun AWS call would only add round-trips. Override
+    codes still take the remote path so the protection check runs.
+    """
+    return not dry_run or bool(override_code)
+
+
+def _dry_run_result() -> dict:
+    """Synthetic details payload for a locally answered dry run."""
+    return {"dry_run": True, "skipped_remote": True}
+
+
+def _audit_request_data(dumper: TypeAdapter, request: Any) -> dict:
+    """Dump a request model once for audit, flagging override usage."""
+    req_dump = dumper.dump_python(request, exclude_unset=True)
+    if request.override_code:
+        return {**req_dump, "override_used": True}
+    return req_dump
+
+
+async def _execute_action(
+    *,
+    action: str,
+    verb: str,
+    resource_type: str,
+    resource_ids: list[str],
+    user: User,
+    http_request: Request,
+    cache: CacheService,
+    audit: AuditService,
+    do_call: Callable[[], Awaitable[dict]],
+    dry_run: bool,
+    override_code: Optional[str] = None,
+    request_data: Optional[dict] = None,
+    safety_check: Optional[Callable[[], Awaitable[None]]] = None,
+) -> ActionResponse:
+    """Run an action through the shared safety/audit/cache pipeline.
+
+    One implementation of the try/except + audit + invalidation dance
+    keeps the ten endpoints to a few lines each and gives CPython a
+    single set of call sites to specialize.
+    """
+    if not _should_remote_check(dry_run, override_code):
+        result = _dry_run_result()
+        action_status = "dry_run"
+        # Compact audit row: a locally answered dry run changed nothing,
+        # so there is no payload worth persisting
+        request_data = None
+    else:
+        if safety_check is not None:
+            await safety_check()
+        try:
+            result = await do_call()
+            action_status = "dry_run" if dry_run else "success"
+        except Exception as e:
+            audit.enqueue_action(
+                user=user,
+                action=action,
+                resource_type=resource_type,
+                resource_ids=resource_ids,
+                request=http_request,
+                status="failed",
+                request_data=request_data,
+                # Formatted lazily by the audit flusher (str() on a
+                # boto3 ClientError can be large)
+                response_data={"exc": e},
+            )
+            raise HTTPException(status_code=500, detail=str(e))
+
+    audit.enqueue_action(
+        user=user,
+        action=action,
+        resource_type=resource_type,
+        resource_ids=resource_ids,
+        request=http_request,
+        status=action_status,
+        request_data=request_data,
+        response_data=result if action_status != "dry_run" else None,
+    )
+
+    if not dry_run:
+        invalidate_fetch_cache()
+        await cache.invalidate_resources(resource_type)
+
+    # model_construct + the precompiled serializer + orjson gives a
+    # serialize-only DTO path with no validation pass in either
+    # direction; returning a Response keeps FastAPI from re-validating
+    # through the response_model
+    payload = _ACTION_RESPONSE_DUMPER.dump_python(
+        ActionResponse.model_construct(
+            status=action_status,
+            action=verb,
+            resource_ids=resource_ids,
+            dry_run=dry_run,
+            details=result,
+        ),
+        mode="json",
+    )
+    if action_status == "dry_run":
+        # 202: request validated and accepted, nothing was changed
+        return ORJSONResponse(payload, status_code=status.HTTP_202_ACCEPTED)
+    return ORJSONResponse(payload)
+
 
 # EC2 Actions
 @router.post("/ec2/start", response_model=ActionResponse)
@@ -30,53 +159,25 @@ async def start_ec2_instances(
     user: RequireOperator,
     cache: Annotated[CacheService, Depends(get_cache_service)],
     http_request: Request,
+    ec2: Annotated[EC2Service, Depends(get_ec2_service)],
+    audit: Annotated[AuditService, Depends(get_audit_service)],
 ):
     """Start EC2 instances."""
-    ec2 = EC2Service()
-    audit = AuditService()
-
-    try:
-        result = await ec2.start_instances(
-            instance_ids=request.resource_ids,
-            dry_run=request.dry_run,
-        )
-        action_status = "dry_run" if request.dry_run else "success"
-        response_data = result
-    except Exception as e:
-        action_status = "failed"
-        response_data = {"error": str(e), "error_type": type(e).__name__}
-        await audit.log_action(
-            user=user,
-            action="ec2:start",
-            resource_type="ec2",
-            resource_ids=request.resource_ids,
-            request=http_request,
-            status=action_status,
-            request_data=request.model_dump(),
-            response_data=response_data,
-        )
-        raise HTTPException(status_code=500, detail=str(e))
-
-    await audit.log_action(
-        user=user,
+    return await _execute_action(
         action="ec2:start",
+        verb="start",
         resource_type="ec2",
         resource_ids=request.resource_ids,
-        request=http_request,
-        status=action_status,
-        request_data=request.model_dump(),
-        response_data=response_data,
-    )
-
-    if not request.dry_run:
-        await cache.invalidate_resources("ec2")
-
-    return ActionResponse(
-        status=action_status,
-        action="start",
-        resource_ids=request.resource_ids,
+        user=user,
+        http_request=http_request,
+        cache=cache,
+        audit=audit,
+        do_call=lambda: ec2.start_instances(
+            instance_ids=request.resource_ids, dry_run=request.dry_run
+        ),
         dry_run=request.dry_run,
-        details=result,
+        override_code=request.override_code,
+        request_data=_audit_request_data(_EC2_DUMPER, request),
     )
 
 
@@ -86,67 +187,31 @@ async def stop_ec2_instances(
     user: RequireOperator,
     cache: Annotated[CacheService, Depends(get_cache_service)],
     http_request: Request,
+    safety: Annotated[SafetyService, Depends(get_safety_service)],
+    ec2: Annotated[EC2Service, Depends(get_ec2_service)],
+    audit: Annotated[AuditService, Depends(get_audit_service)],
 ):
     """Stop EC2 instances."""
-    safety = SafetyService()
-    ec2 = EC2Service()
-    audit = AuditService()
-
-    # Check production protection
-    for instance_id in request.resource_ids:
-        await safety.check_production_protection(
-            resource_type="ec2",
-            resource_id=instance_id,
-            override_code=request.override_code,
-        )
-
-    try:
-        result = await ec2.stop_instances(
-            instance_ids=request.resource_ids,
-            dry_run=request.dry_run,
-        )
-        action_status = "dry_run" if request.dry_run else "success"
-        response_data = result
-    except Exception as e:
-        action_status = "failed"
-        response_data = {"error": str(e), "error_type": type(e).__name__}
-        await audit.log_action(
-            user=user,
-            action="ec2:stop",
-            resource_type="ec2",
-            resource_ids=request.resource_ids,
-            request=http_request,
-            status=action_status,
-            request_data=request.model_dump(),
-            response_data=response_data,
-        )
-        raise HTTPException(status_code=500, detail=str(e))
-
-    # Build request_data with override flag
-    audit_request_data = request.model_dump()
-    if request.override_code:
-        audit_request_data["override_used"] = True
-
-    await audit.log_action(
-        user=user,
+    return await _execute_action(
         action="ec2:stop",
+        verb="stop",
         resource_type="ec2",
         resource_ids=request.resource_ids,
-        request=http_request,
-        status=action_status,
-        request_data=audit_request_data,
-        response_data=response_data,
-    )
-
-    if not request.dry_run:
-        await cache.invalidate_resources("ec2")
-
-    return ActionResponse(
-        status=action_status,
-        action="stop",
-        resource_ids=request.resource_ids,
+        user=user,
+        http_request=http_request,
+        cache=cache,
+        audit=audit,
+        do_call=lambda: ec2.stop_instances(
+            instance_ids=request.resource_ids, dry_run=request.dry_run
+        ),
         dry_run=request.dry_run,
-        details=result,
+        override_code=request.override_code,
+        request_data=_audit_request_data(_EC2_DUMPER, request),
+        safety_check=lambda: safety.check_production_protection_bulk(
+            resource_type="ec2",
+            resource_ids=request.resource_ids,
+            override_code=request.override_code,
+        ),
     )
 
 
@@ -156,67 +221,31 @@ async def terminate_ec2_instances(
     user: RequireAdmin,
     cache: Annotated[CacheService, Depends(get_cache_service)],
     http_request: Request,
+    safety: Annotated[SafetyService, Depends(get_safety_service)],
+    ec2: Annotated[EC2Service, Depends(get_ec2_service)],
+    audit: Annotated[AuditService, Depends(get_audit_service)],
 ):
     """Terminate EC2 instances (admin only)."""
-    safety = SafetyService()
-    ec2 = EC2Service()
-    audit = AuditService()
-
-    # Check production protection
-    for instance_id in request.resource_ids:
-        await safety.check_production_protection(
-            resource_type="ec2",
-            resource_id=instance_id,
-            override_code=request.override_code,
-        )
-
-    try:
-        result = await ec2.terminate_instances(
-            instance_ids=request.resource_ids,
-            dry_run=request.dry_run,
-        )
-        action_status = "dry_run" if request.dry_run else "success"
-        response_data = result
-    except Exception as e:
-        action_status = "failed"
-        response_data = {"error": str(e), "error_type": type(e).__name__}
-        await audit.log_action(
-            user=user,
-            action="ec2:terminate",
-            resource_type="ec2",
-            resource_ids=request.resource_ids,
-            request=http_request,
-            status=action_status,
-            request_data=request.model_dump(),
-            response_data=response_data,
-        )
-        raise HTTPException(status_code=500, detail=str(e))
-
-    # Build request_data with override flag
-    audit_request_data = request.model_dump()
-    if request.override_code:
-        audit_request_data["override_used"] = True
-
-    await audit.log_action(
-        user=user,
+    return await _execute_action(
         action="ec2:terminate",
+        verb="terminate",
         resource_type="ec2",
         resource_ids=request.resource_ids,
-        request=http_request,
-        status=action_status,
-        request_data=audit_request_data,
-        response_data=response_data,
-    )
-
-    if not request.dry_run:
-        await cache.invalidate_resources("ec2")
-
-    return ActionResponse(
-        status=action_status,
-        action="terminate",
-        resource_ids=request.resource_ids,
+        user=user,
+        http_request=http_request,
+        cache=cache,
+        audit=audit,
+        do_call=lambda: ec2.terminate_instances(
+            instance_ids=request.resource_ids, dry_run=request.dry_run
+        ),
         dry_run=request.dry_run,
-        details=result,
+        override_code=request.override_code,
+        request_data=_audit_request_data(_EC2_DUMPER, request),
+        safety_check=lambda: safety.check_production_protection_bulk(
+            resource_type="ec2",
+            resource_ids=request.resource_ids,
+            override_code=request.override_code,
+        ),
     )
 
 
@@ -227,53 +256,26 @@ async def start_rds_instance(
     user: RequireOperator,
     cache: Annotated[CacheService, Depends(get_cache_service)],
     http_request: Request,
+    rds: Annotated[RDSService, Depends(get_rds_service)],
+    audit: Annotated[AuditService, Depends(get_audit_service)],
 ):
     """Start RDS instance."""
-    rds = RDSService()
-    audit = AuditService()
-
-    try:
-        result = await rds.start_instance(
-            db_instance_identifier=request.db_instance_identifier,
-            dry_run=request.dry_run,
-        )
-        action_status = "dry_run" if request.dry_run else "success"
-        response_data = result
-    except Exception as e:
-        action_status = "failed"
-        response_data = {"error": str(e), "error_type": type(e).__name__}
-        await audit.log_action(
-            user=user,
-            action="rds:start",
-            resource_type="rds",
-            resource_ids=[request.db_instance_identifier],
-            request=http_request,
-            status=action_status,
-            request_data=request.model_dump(),
-            response_data=response_data,
-        )
-        raise HTTPException(status_code=500, detail=str(e))
-
-    await audit.log_action(
-        user=user,
+    return await _execute_action(
         action="rds:start",
+        verb="start",
         resource_type="rds",
         resource_ids=[request.db_instance_identifier],
-        request=http_request,
-        status=action_status,
-        request_data=request.model_dump(),
-        response_data=response_data,
-    )
-
-    if not request.dry_run:
-        await cache.invalidate_resources("rds")
-
-    return ActionResponse(
-        status=action_status,
-        action="start",
-        resource_ids=[request.db_instance_identifier],
+        user=user,
+        http_request=http_request,
+        cache=cache,
+        audit=audit,
+        do_call=lambda: rds.start_instance(
+            db_instance_identifier=request.db_instance_identifier,
+            dry_run=request.dry_run,
+        ),
         dry_run=request.dry_run,
-        details=result,
+        override_code=request.override_code,
+        request_data=_audit_request_data(_RDS_DUMPER, request),
     )
 
 
@@ -283,65 +285,32 @@ async def stop_rds_instance(
     user: RequireOperator,
     cache: Annotated[CacheService, Depends(get_cache_service)],
     http_request: Request,
+    safety: Annotated[SafetyService, Depends(get_safety_service)],
+    rds: Annotated[RDSService, Depends(get_rds_service)],
+    audit: Annotated[AuditService, Depends(get_audit_service)],
 ):
     """Stop RDS instance."""
-    safety = SafetyService()
-    rds = RDSService()
-    audit = AuditService()
-
-    await safety.check_production_protection(
-        resource_type="rds",
-        resource_id=request.db_instance_identifier,
-        override_code=request.override_code,
-    )
-
-    try:
-        result = await rds.stop_instance(
-            db_instance_identifier=request.db_instance_identifier,
-            dry_run=request.dry_run,
-        )
-        action_status = "dry_run" if request.dry_run else "success"
-        response_data = result
-    except Exception as e:
-        action_status = "failed"
-        response_data = {"error": str(e), "error_type": type(e).__name__}
-        await audit.log_action(
-            user=user,
-            action="rds:stop",
-            resource_type="rds",
-            resource_ids=[request.db_instance_identifier],
-            request=http_request,
-            status=action_status,
-            request_data=request.model_dump(),
-            response_data=response_data,
-        )
-        raise HTTPException(status_code=500, detail=str(e))
-
-    # Build request_data with override flag
-    audit_request_data = request.model_dump()
-    if request.override_code:
-        audit_request_data["override_used"] = True
-
-    await audit.log_action(
-        user=user,
+    return await _execute_action(
         action="rds:stop",
+        verb="stop",
         resource_type="rds",
         resource_ids=[request.db_instance_identifier],
-        request=http_request,
-        status=action_status,
-        request_data=audit_request_data,
-        response_data=response_data,
-    )
-
-    if not request.dry_run:
-        await cache.invalidate_resources("rds")
-
-    return ActionResponse(
-        status=action_status,
-        action="stop",
-        resource_ids=[request.db_instance_identifier],
+        user=user,
+        http_request=http_request,
+        cache=cache,
+        audit=audit,
+        do_call=lambda: rds.stop_instance(
+            db_instance_identifier=request.db_instance_identifier,
+            dry_run=request.dry_run,
+        ),
         dry_run=request.dry_run,
-        details=result,
+        override_code=request.override_code,
+        request_data=_audit_request_data(_RDS_DUMPER, request),
+        safety_check=lambda: safety.check_production_protection(
+            resource_type="rds",
+            resource_id=request.db_instance_identifier,
+            override_code=request.override_code,
+        ),
     )
 
 
@@ -351,71 +320,40 @@ async def delete_rds_instance(
     user: RequireAdmin,
     cache: Annotated[CacheService, Depends(get_cache_service)],
     http_request: Request,
+    safety: Annotated[SafetyService, Depends(get_safety_service)],
+    rds: Annotated[RDSService, Depends(get_rds_service)],
+    audit: Annotated[AuditService, Depends(get_audit_service)],
     dry_run: bool = Query(default=True),
     skip_final_snapshot: bool = Query(default=False),
     override_code: str = Query(default=None),
 ):
     """Delete RDS instance (admin only)."""
-    safety = SafetyService()
-    rds = RDSService()
-    audit = AuditService()
-
-    await safety.check_production_protection(
-        resource_type="rds",
-        resource_id=db_instance_identifier,
-        override_code=override_code,
-    )
-
     request_data = {"skip_final_snapshot": skip_final_snapshot}
-
-    try:
-        result = await rds.delete_instance(
-            db_instance_identifier=db_instance_identifier,
-            skip_final_snapshot=skip_final_snapshot,
-            dry_run=dry_run,
-        )
-        action_status = "dry_run" if dry_run else "success"
-        response_data = result
-    except Exception as e:
-        action_status = "failed"
-        response_data = {"error": str(e), "error_type": type(e).__name__}
-        await audit.log_action(
-            user=user,
-            action="rds:delete",
-            resource_type="rds",
-            resource_ids=[db_instance_identifier],
-            request=http_request,
-            status=action_status,
-            request_data=request_data,
-            response_data=response_data,
-        )
-        raise HTTPException(status_code=500, detail=str(e))
-
-    # Build request_data with override flag
-    audit_request_data = {"skip_final_snapshot": skip_final_snapshot}
     if override_code:
-        audit_request_data["override_used"] = True
+        request_data["override_used"] = True
 
-    await audit.log_action(
-        user=user,
+    return await _execute_action(
         action="rds:delete",
+        verb="delete",
         resource_type="rds",
         resource_ids=[db_instance_identifier],
-        request=http_request,
-        status=action_status,
-        request_data=audit_request_data,
-        response_data=response_data,
-    )
-
-    if not dry_run:
-        await cache.invalidate_resources("rds")
-
-    return ActionResponse(
-        status=action_status,
-        action="delete",
-        resource_ids=[db_instance_identifier],
+        user=user,
+        http_request=http_request,
+        cache=cache,
+        audit=audit,
+        do_call=lambda: rds.delete_instance(
+            db_instance_identifier=db_instance_identifier,
+            skip_final_snapshot=skip_final_snapshot,
+            dry_run=dry_run,
+        ),
         dry_run=dry_run,
-        details=result,
+        override_code=override_code,
+        request_data=request_data,
+        safety_check=lambda: safety.check_production_protection(
+            resource_type="rds",
+            resource_id=db_instance_identifier,
+            override_code=override_code,
+        ),
     )
 
 
@@ -426,69 +364,36 @@ async def scale_ecs_service(
     user: RequireOperator,
     cache: Annotated[CacheService, Depends(get_cache_service)],
     http_request: Request,
+    safety: Annotated[SafetyService, Depends(get_safety_service)],
+    ecs: Annotated[ECSService, Depends(get_ecs_service)],
+    audit: Annotated[AuditService, Depends(get_audit_service)],
 ):
     """Scale ECS service."""
-    safety = SafetyService()
-    ecs = ECSService()
-    audit = AuditService()
-
-    await safety.check_production_protection(
-        resource_type="ecs",
-        resource_id=f"{request.cluster}/{request.service}",
-        override_code=request.override_code,
-    )
-
     resource_id = f"{request.cluster}/{request.service}"
 
-    try:
-        result = await ecs.scale_service(
+    return await _execute_action(
+        action="ecs:scale",
+        verb="scale",
+        resource_type="ecs",
+        resource_ids=[resource_id],
+        user=user,
+        http_request=http_request,
+        cache=cache,
+        audit=audit,
+        do_call=lambda: ecs.scale_service(
             cluster=request.cluster,
             service=request.service,
             desired_count=request.desired_count,
             dry_run=request.dry_run,
-        )
-        action_status = "dry_run" if request.dry_run else "success"
-        response_data = result
-    except Exception as e:
-        action_status = "failed"
-        response_data = {"error": str(e), "error_type": type(e).__name__}
-        await audit.log_action(
-            user=user,
-            action="ecs:scale",
-            resource_type="ecs",
-            resource_ids=[resource_id],
-            request=http_request,
-            status=action_status,
-            request_data=request.model_dump(),
-            response_data=response_data,
-        )
-        raise HTTPException(status_code=500, detail=str(e))
-
-    # Build request_data with override flag
-    audit_request_data = request.model_dump()
-    if request.override_code:
-        audit_request_data["override_used"] = True
-
-    await audit.log_action(
-        user=user,
-        action="ecs:scale",
-        resource_type="ecs",
-        resource_ids=[resource_id],
-        request=http_request,
-        status=action_status,
-        request_data=audit_request_data,
-        response_data=response_data,
-    )
-
-    if not request.dry_run:
-        await cache.invalidate_resources("ecs")
-
-    return ActionResponse(
-        status=action_status,
-        action="scale",
-        resource_ids=[resource_id],
+        ),
         dry_run=request.dry_run,
-        details=result,
+        override_code=request.override_code,
+        request_data=_audit_request_data(_ECS_DUMPER, request),
+        safety_check=lambda: safety.check_production_protection(
+            resource_type="ecs",
+            resource_id=resource_id,
+            override_code=request.override_code,
+        ),
     )
 
 
@@ -499,71 +404,40 @@ async def delete_s3_bucket(
     user: RequireAdmin,
     cache: Annotated[CacheService, Depends(get_cache_service)],
     http_request: Request,
+    safety: Annotated[SafetyService, Depends(get_safety_service)],
+    s3: Annotated[S3Service, Depends(get_s3_service)],
+    audit: Annotated[AuditService, Depends(get_audit_service)],
     dry_run: bool = Query(default=True),
     force_delete: bool = Query(default=False, description="Delete bucket contents first"),
     override_code: str = Query(default=None),
 ):
     """Delete S3 bucket (admin only)."""
-    safety = SafetyService()
-    s3 = S3Service()
-    audit = AuditService()
-
-    await safety.check_production_protection(
-        resource_type="s3",
-        resource_id=bucket_name,
-        override_code=override_code,
-    )
-
     request_data = {"force_delete": force_delete}
-
-    try:
-        result = await s3.delete_bucket(
-            bucket_name=bucket_name,
-            force_delete=force_delete,
-            dry_run=dry_run,
-        )
-        action_status = "dry_run" if dry_run else "success"
-        response_data = result
-    except Exception as e:
-        action_status = "failed"
-        response_data = {"error": str(e), "error_type": type(e).__name__}
-        await audit.log_action(
-            user=user,
-            action="s3:delete",
-            resource_type="s3",
-            resource_ids=[bucket_name],
-            request=http_request,
-            status=action_status,
-            request_data=request_data,
-            response_data=response_data,
-        )
-        raise HTTPException(status_code=500, detail=str(e))
-
-    # Build request_data with override flag
-    audit_request_data = {"force_delete": force_delete}
     if override_code:
-        audit_request_data["override_used"] = True
+        request_data["override_used"] = True
 
-    await audit.log_action(
-        user=user,
+    return await _execute_action(
         action="s3:delete",
+        verb="delete",
         resource_type="s3",
         resource_ids=[bucket_name],
-        request=http_request,
-        status=action_status,
-        request_data=audit_request_data,
-        response_data=response_data,
-    )
-
-    if not dry_run:
-        await cache.invalidate_resources("s3")
-
-    return ActionResponse(
-        status=action_status,
-        action="delete",
-        resource_ids=[bucket_name],
+        user=user,
+        http_request=http_request,
+        cache=cache,
+        audit=audit,
+        do_call=lambda: s3.delete_bucket(
+            bucket_name=bucket_name,
+            force_delete=force_delete,
+            dry_run=dry_run,
+        ),
         dry_run=dry_run,
-        details=result,
+        override_code=override_code,
+        request_data=request_data,
+        safety_check=lambda: safety.check_production_protection(
+            resource_type="s3",
+            resource_id=bucket_name,
+            override_code=override_code,
+        ),
     )
 
 
@@ -574,64 +448,29 @@ async def delete_ebs_volume(
     user: RequireAdmin,
     cache: Annotated[CacheService, Depends(get_cache_service)],
     http_request: Request,
+    safety: Annotated[SafetyService, Depends(get_safety_service)],
+    ec2: Annotated[EC2Service, Depends(get_ec2_service)],
+    audit: Annotated[AuditService, Depends(get_audit_service)],
     dry_run: bool = Query(default=True),
     override_code: str = Query(default=None),
 ):
     """Delete EBS volume (admin only)."""
-    safety = SafetyService()
-    ec2 = EC2Service()
-    audit = AuditService()
-
-    await safety.check_production_protection(
-        resource_type="ebs",
-        resource_id=volume_id,
-        override_code=override_code,
-    )
-
-    try:
-        result = await ec2.delete_volume(
-            volume_id=volume_id,
-            dry_run=dry_run,
-        )
-        action_status = "dry_run" if dry_run else "success"
-        response_data = result
-    except Exception as e:
-        action_status = "failed"
-        response_data = {"error": str(e), "error_type": type(e).__name__}
-        await audit.log_action(
-            user=user,
-            action="ebs:delete",
-            resource_type="ebs",
-            resource_ids=[volume_id],
-            request=http_request,
-            status=action_status,
-            response_data=response_data,
-        )
-        raise HTTPException(status_code=500, detail=str(e))
-
-    # Build request_data with override flag
-    audit_request_data = {}
-    if override_code:
-        audit_request_data["override_used"] = True
-
-    await audit.log_action(
-        user=user,
+    return await _execute_action(
         action="ebs:delete",
+        verb="delete",
         resource_type="ebs",
         resource_ids=[volume_id],
-        request=http_request,
-        status=action_status,
-        request_data=audit_request_data if audit_request_data else None,
-        response_data=response_data,
-    )
-
-    if not dry_run:
-        await cache.invalidate_resources("ebs")
-
-    return ActionResponse(
-        status=action_status,
-        action="delete",
-        resource_ids=[volume_id],
+        user=user,
+        http_request=http_request,
+        cache=cache,
+        audit=audit,
+        do_call=lambda: ec2.delete_volume(volume_id=volume_id, dry_run=dry_run),
         dry_run=dry_run,
-        details=result,
+        override_code=override_code,
+        request_data={"override_used": True} if override_code else None,
+        safety_check=lambda: safety.check_production_protection(
+            resource_type="ebs",
+            resource_id=volume_id,
+            override_code=override_code,
+        ),
     )
@@ -2,16 +2,18 @@
 
 import csv
 import io
-import json
 from datetime import datetime
-from typing import Annotated, Literal, Optional
+from typing import Annotated, AsyncIterator, Literal, Optional
 
+from uuid import UUID
+
+import orjson
 from fastapi import APIRouter, Depends, Query
-from fastapi.responses import StreamingResponse
-from sqlalchemy import select, func, desc
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy import Text, cast, select, func, desc, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import async_session_maker, get_db
 from app.dependencies import RequireAdmin
 from app.models.database import AuditLog, User
 from app.models.schemas import AuditLogResponse, AuditLogListResponse
@@ -19,6 +21,18 @@ from app.models.schemas import AuditLogResponse, AuditLogListResponse
 router = APIRouter()
 
 MAX_EXPORT_RECORDS = 10000
+EXPORT_YIELD_PER = 500
+
+
+def _text_filter(column, value: str):
+    """Equality unless the caller asked for a wildcard match.
+
+    Exact values ("ec2:start") hit the b-tree index; a value containing
+    % or * opts into ILIKE, which the trigram index serves.
+    """
+    if "%" in value or "*" in value:
+        return column.ilike(value.replace("*", "%"))
+    return column == value
 
 
 @router.get("", response_model=AuditLogListResponse)
@@ -33,66 +47,119 @@ async def list_audit_logs(
     start_date: Optional[datetime] = Query(None, description="Filter from date"),
     end_date: Optional[datetime] = Query(None, description="Filter to date"),
     status: Optional[str] = Query(None, description="Filter by status"),
+    cursor: Optional[datetime] = Query(
+        None, description="Keyset cursor: created_at of the last row seen"
+    ),
+    cursor_id: Optional[UUID] = Query(
+        None, description="Keyset cursor: id of the last row seen"
+    ),
 ):
-    """List audit logs with filtering and pagination (admin only)."""
-    # Build query
-    query = select(AuditLog).join(User, AuditLog.user_id == User.id, isouter=True)
+    """List audit logs with filtering and pagination (admin only).
 
+    Passing cursor/cursor_id (from next_cursor/next_cursor_id of the
+    previous page) paginates by keyset instead of OFFSET, which stays
+    fast at any depth; the page parameter is ignored in that mode.
+    """
+    # Filter predicates shared by the data query and the fallback count
+    conds = []
     if action:
-        query = query.where(AuditLog.action.ilike(f"%{action}%"))
+        conds.append(_text_filter(AuditLog.action, action))
     if resource_type:
-        query = query.where(AuditLog.resource_type == resource_type)
+        conds.append(AuditLog.resource_type == resource_type)
     if user_email:
-        query = query.where(User.email.ilike(f"%{user_email}%"))
+        conds.append(_text_filter(User.email, user_email))
     if start_date:
-        query = query.where(AuditLog.created_at >= start_date)
+        conds.append(AuditLog.created_at >= start_date)
     if end_date:
-        query = query.where(AuditLog.created_at <= end_date)
+        conds.append(AuditLog.created_at <= end_date)
     if status:
-        query = query.where(AuditLog.status == status)
+        conds.append(AuditLog.status == status)
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = await db.scalar(count_query)
+    # Paginate: keyset when a cursor is supplied, OFFSET otherwise
+    use_cursor = cursor is not None and cursor_id is not None
+    if use_cursor:
+        conds.append(
+            tuple_(AuditLog.created_at, AuditLog.id) < tuple_(cursor, cursor_id)
+        )
 
-    # Paginate
-    query = query.order_by(desc(AuditLog.created_at))
-    query = query.offset((page - 1) * page_size).limit(page_size)
+    # Window-function count rides along with the page instead of running
+    # the filtered join a second time for a separate COUNT(*); selecting
+    # plain columns (email included, off the existing join) skips ORM
+    # entity construction entirely
+    query = (
+        select(
+            AuditLog.id,
+            User.email.label("user_email"),
+            AuditLog.action,
+            AuditLog.resource_type,
+            AuditLog.resource_id,
+            AuditLog.aws_account_id,
+            AuditLog.region,
+            AuditLog.status,
+            AuditLog.request_data,
+            AuditLog.response_data,
+            AuditLog.created_at,
+            func.count().over().label("total_count"),
+        )
+        .join(User, AuditLog.user_id == User.id, isouter=True)
+        .where(*conds)
+        .order_by(desc(AuditLog.created_at), desc(AuditLog.id))
+    )
+    if not use_cursor:
+        query = query.offset((page - 1) * page_size)
+    query = query.limit(page_size)
 
     result = await db.execute(query)
-    logs = result.scalars().all()
+    rows = result.all()
 
-    # Build response with user emails
+    if rows:
+        total = rows[0].total_count
+    elif page == 1:
+        total = 0
+    else:
+        # Page past the end returns no rows (and no window count), so
+        # fall back to a plain count; join users only when the email
+        # filter actually references them
+        count_query = select(func.count()).select_from(AuditLog)
+        if user_email:
+            count_query = count_query.join(
+                User, AuditLog.user_id == User.id, isouter=True
+            )
+        total = await db.scalar(count_query.where(*conds))
+
+    # Rows are plain column tuples; serialize them straight to JSON via
+    # orjson instead of round-tripping through pydantic models
     items = []
-    for log in logs:
-        log_response = AuditLogResponse(
-            id=log.id,
-            user_email=log.user.email if log.user else None,
-            action=log.action,
-            resource_type=log.resource_type,
-            resource_id=log.resource_id,
-            aws_account_id=log.aws_account_id,
-            region=log.region,
-            status=log.status,
-            request_data=log.request_data,
-            response_data=log.response_data,
-            created_at=log.created_at,
-        )
-        items.append(log_response)
-
-    return AuditLogListResponse(
-        items=items,
-        total=total,
-        page=page,
-        page_size=page_size,
-        has_more=(page * page_size) < total,
+    for row in rows:
+        item = dict(row._mapping)
+        item.pop("total_count")
+        items.append(item)
+
+    # Hand back a cursor whenever a full page came back
+    next_cursor = next_cursor_id = None
+    if len(rows) == page_size:
+        next_cursor = rows[-1].created_at
+        next_cursor_id = rows[-1].id
+
+    # In cursor mode total counts the rows from the cursor onwards
+    has_more = total > page_size if use_cursor else (page * page_size) < total
+
+    return ORJSONResponse(
+        {
+            "items": items,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
+            "next_cursor_id": next_cursor_id,
+        }
     )
 
 
 @router.get("/export")
 async def export_audit_logs(
     user: RequireAdmin,
-    db: Annotated[AsyncSession, Depends(get_db)],
     format: Literal["csv", "json"] = Query("csv", description="Export format"),
     action: Optional[str] = Query(None, description="Filter by action type"),
     resource_type: Optional[str] = Query(None, description="Filter by resource type"),
@@ -101,16 +168,45 @@ async def export_audit_logs(
     end_date: Optional[datetime] = Query(None, description="Filter to date"),
     status: Optional[str] = Query(None, description="Filter by status"),
 ):
-    """Export audit logs as CSV or JSON (admin only). Max 10,000 records."""
+    """Export audit logs as CSV or JSON (admin only). Max 10,000 records.
+
+    Rows stream straight from a server-side cursor to the response, so
+    memory stays flat regardless of export size; the user email comes off
+    the join, not per-row lazy loads. The stream generators open their
+    own session: the request-scoped one is torn down before the response
+    body is iterated, and using it there would leak a pool connection
+    per export.
+    """
+    # CSV wants the payload columns as text anyway, so let the database
+    # serialize JSONB instead of re-dumping each one in Python per row
+    if format == "csv":
+        request_data_col = cast(AuditLog.request_data, Text).label("request_data")
+        response_data_col = cast(AuditLog.response_data, Text).label("response_data")
+    else:
+        request_data_col = AuditLog.request_data
+        response_data_col = AuditLog.response_data
+
     # Build query with same filters as list endpoint
-    query = select(AuditLog).join(User, AuditLog.user_id == User.id, isouter=True)
+    query = select(
+        AuditLog.id,
+        User.email.label("user_email"),
+        AuditLog.action,
+        AuditLog.resource_type,
+        AuditLog.resource_id,
+        AuditLog.aws_account_id,
+        AuditLog.region,
+        AuditLog.status,
+        request_data_col,
+        response_data_col,
+        AuditLog.created_at,
+    ).join(User, AuditLog.user_id == User.id, isouter=True)
 
     if action:
-        query = query.where(AuditLog.action.ilike(f"%{action}%"))
+        query = query.where(_text_filter(AuditLog.action, action))
     if resource_type:
         query = query.where(AuditLog.resource_type == resource_type)
     if user_email:
-        query = query.where(User.email.ilike(f"%{user_email}%"))
+        query = query.where(_text_filter(User.email, user_email))
     if start_date:
         query = query.where(AuditLog.created_at >= start_date)
     if end_date:
@@ -121,66 +217,82 @@ async def export_audit_logs(
     # Order and limit
     query = query.order_by(desc(AuditLog.created_at)).limit(MAX_EXPORT_RECORDS)
 
-    result = await db.execute(query)
-    logs = result.scalars().all()
-
     if format == "json":
-        # Export as JSON
-        export_data = []
-        for log in logs:
-            export_data.append({
-                "id": str(log.id),
-                "user_email": log.user.email if log.user else None,
-                "action": log.action,
-                "resource_type": log.resource_type,
-                "resource_id": log.resource_id,
-                "aws_account_id": log.aws_account_id,
-                "region": log.region,
-                "status": log.status,
-                "request_data": log.request_data,
-                "response_data": log.response_data,
-                "created_at": log.created_at.isoformat(),
-            })
-
-        json_content = json.dumps(export_data, indent=2)
         return StreamingResponse(
-            io.StringIO(json_content),
+            _stream_json(query),
             media_type="application/json",
-            headers={"Content-Disposition": "attachment; filename=audit_logs.json"},
+            headers={
+                "Content-Disposition": "attachment; filename=audit_logs.json",
+                # Tell nginx-style proxies not to rebuffer the stream
+                "X-Accel-Buffering": "no",
+            },
         )
-    else:
-        # Export as CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Header row
-        writer.writerow([
-            "id", "user_email", "action", "resource_type", "resource_id",
-            "aws_account_id", "region", "status", "request_data", "response_data", "created_at"
-        ])
-
-        # Data rows
-        for log in logs:
-            writer.writerow([
-                str(log.id),
-                log.user.email if log.user else "",
-                log.action,
-                log.resource_type,
-                log.resource_id,
-                log.aws_account_id or "",
-                log.region or "",
-                log.status,
-                json.dumps(log.request_data) if log.request_data else "",
-                json.dumps(log.response_data) if log.response_data else "",
-                log.created_at.isoformat(),
-            ])
+    return StreamingResponse(
+        _stream_csv(query),
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": "attachment; filename=audit_logs.csv",
+            "X-Accel-Buffering": "no",
+        },
+    )
 
-        output.seek(0)
-        return StreamingResponse(
-            output,
-            media_type="text/csv",
-            headers={"Content-Disposition": "attachment; filename=audit_logs.csv"},
+
+async def _stream_json(query) -> AsyncIterator[bytes]:
+    """Yield the export as a JSON array, one orjson-encoded row at a time.
+
+    Runs on its own session: dependency teardown has already closed the
+    request session by the time the response body is iterated.
+    """
+    async with async_session_maker() as session:
+        yield b"["
+        first = True
+        result = await session.stream(
+            query.execution_options(yield_per=EXPORT_YIELD_PER)
+        )
+        async for row in result:
+            doc = orjson.dumps(dict(row._mapping))
+            yield doc if first else b"," + doc
+            first = False
+        yield b"]"
+
+
+async def _stream_csv(query) -> AsyncIterator[str]:
+    """Yield the export as CSV, reusing one small buffer per row.
+
+    Runs on its own session for the same reason as _stream_json.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow([
+        "id", "user_email", "action", "resource_type", "resource_id",
+        "aws_account_id", "region", "status", "request_data", "response_data", "created_at"
+    ])
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate(0)
+
+    async with async_session_maker() as session:
+        result = await session.stream(
+            query.execution_options(yield_per=EXPORT_YIELD_PER)
         )
+        async for row in result:
+            writer.writerow([
+                str(row.id),
+                row.user_email or "",
+                row.action,
+                row.resource_type,
+                row.resource_id,
+                row.aws_account_id or "",
+                row.region or "",
+                row.status,
+                row.request_data or "",
+                row.response_data or "",
+                row.created_at.isoformat(),
+            ])
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
 
 
 @router.get("/{log_id}", response_model=AuditLogResponse)
@@ -190,24 +302,30 @@ async def get_audit_log(
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Get detailed audit log entry (admin only)."""
-    query = select(AuditLog).where(AuditLog.id == log_id)
+    # Email comes off the join like the list/export queries; no lazy
+    # relationship load on the async session
+    query = (
+        select(
+            AuditLog.id,
+            User.email.label("user_email"),
+            AuditLog.action,
+            AuditLog.resource_type,
+            AuditLog.resource_id,
+            AuditLog.aws_account_id,
+            AuditLog.region,
+            AuditLog.status,
+            AuditLog.request_data,
+            AuditLog.response_data,
+            AuditLog.created_at,
+        )
+        .join(User, AuditLog.user_id == User.id, isouter=True)
+        .where(AuditLog.id == log_id)
+    )
     result = await db.execute(query)
-    log = result.scalar_one_or_none()
+    log = result.one_or_none()
 
     if not log:
         from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Audit log not found")
 
-    return AuditLogResponse(
-        id=log.id,
-        user_email=log.user.email if log.user else None,
-        action=log.action,
-        resource_type=log.resource_type,
-        resource_id=log.resource_id,
-        aws_account_id=log.aws_account_id,
-        region=log.region,
-        status=log.status,
-        request_data=log.request_data,
-        response_data=log.response_data,
-        created_at=log.created_at,
-    )
+    return AuditLogResponse(**log._mapping)
@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.dependencies import get_current_user
+from app.dependencies import get_audit_service, get_auth_service, get_current_user
 from app.models.database import User
 from app.models.schemas import UserResponse, LoginRequest, TokenResponse
 from app.services.auth import AuthService
@@ -20,11 +20,10 @@ async def login(
     request: LoginRequest,
     db: Annotated[AsyncSession, Depends(get_db)],
     http_request: Request,
+    auth_service: Annotated[AuthService, Depends(get_auth_service)],
+    audit: Annotated[AuditService, Depends(get_audit_service)],
 ):
     """Authenticate user with Cognito."""
-    auth_service = AuthService()
-    audit = AuditService()
-
     try:
         result = await auth_service.authenticate(
             request.username, request.password
@@ -37,7 +36,8 @@ async def login(
             email=request.username,
         )
 
-        # Log successful login
+        # Log successful login on the request's session — no second
+        # pool checkout for the audit row
         await audit.log_action(
             user=user,
             action="auth:login",
@@ -46,6 +46,7 @@ async def login(
             request=http_request,
             status="success",
             request_data={"username": request.username},
+            session=db,
         )
 
         return TokenResponse(
@@ -64,6 +65,7 @@ async def login(
             status="failed",
             request_data={"username": request.username},
             response_data={"error": str(e), "error_type": type(e).__name__},
+            session=db,
         )
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -72,11 +74,13 @@ async def login(
 
 
 @router.post("/refresh", response_model=TokenResponse)
-async def refresh_token(refresh_token: str, http_request: Request):
+async def refresh_token(
+    refresh_token: str,
+    http_request: Request,
+    auth_service: Annotated[AuthService, Depends(get_auth_service)],
+    audit: Annotated[AuditService, Depends(get_audit_service)],
+):
     """Refresh access token."""
-    auth_service = AuthService()
-    audit = AuditService()
-
     try:
         result = await auth_service.refresh_token(refresh_token)
 
@@ -123,10 +127,9 @@ async def get_current_user_info(
 async def logout(
     user: Annotated[User, Depends(get_current_user)],
     http_request: Request,
+    audit: Annotated[AuditService, Depends(get_audit_service)],
 ):
     """Logout user (client should discard tokens)."""
-    audit = AuditService()
-
     # Log logout event
     await audit.log_action(
         user=user,
@@ -2,10 +2,12 @@
 
 from typing import Annotated, Optional
 import csv
+import hashlib
 import io
 import json
 
-from fastapi import APIRouter, Depends, Query, Response
+import orjson
+from fastapi import APIRouter, Depends, Query
 from fastapi.responses import StreamingResponse
 
 from app.dependencies import RequireReadonly, get_cache_service
@@ -28,6 +30,8 @@ async def list_resources(
     search: Optional[str] = Query(None, description="Search in name/id"),
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Keyset cursor: last item's sort name"),
+    cursor_id: Optional[str] = Query(None, description="Keyset cursor: last item's resource_id"),
 ):
     """List AWS resources with filtering and pagination."""
     filters = ResourceFilters(
@@ -39,8 +43,14 @@ async def list_resources(
         search=search,
     )
 
-    # Try cache first
-    cache_key = f"resources:list:{hash(str(filters.model_dump()))}:{page}:{page_size}"
+    # Try cache first. The filter digest must be stable across workers —
+    # builtin hash() is salted per process, which would give every uvicorn
+    # worker its own private cache entries
+    digest = hashlib.blake2b(
+        orjson.dumps(filters.model_dump(), option=orjson.OPT_SORT_KEYS),
+        digest_size=16,
+    ).hexdigest()
+    cache_key = f"resources:list:{digest}:{page}:{page_size}:{cursor}:{cursor_id}"
     cached = await cache.get(cache_key)
     if cached:
         return ResourceListResponse(**cached)
@@ -51,10 +61,17 @@ async def list_resources(
         filters=filters,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        cursor_id=cursor_id,
     )
 
-    # Cache result
-    await cache.set(cache_key, result.model_dump())
+    # Cache result, tagged so mutations can invalidate exactly these keys
+    cache_tags = (
+        (f"resources:{filters.resource_type}",)
+        if filters.resource_type
+        else ("resources:all",)
+    )
+    await cache.set(cache_key, result.model_dump(), tags=cache_tags)
 
     return result
 
@@ -74,7 +91,8 @@ async def get_resource(
     aggregator = ResourceAggregator()
     resource = await aggregator.get_resource_by_id(resource_id)
 
-    await cache.set(cache_key, resource.model_dump())
+    # Detail entries aren't typed by key, so register under the catch-all tag
+    await cache.set(cache_key, resource.model_dump(), tags=("resources:all",))
     return resource
 
 
@@ -84,19 +102,34 @@ async def export_resources_csv(
     resource_type: Optional[str] = Query(None),
     region: Optional[str] = Query(None),
 ):
-    """Export resources as CSV."""
+    """Export resources as CSV, streamed row by row."""
     aggregator = ResourceAggregator()
     filters = ResourceFilters(resource_type=resource_type, region=region)
-    result = await aggregator.get_resources(filters=filters, page=1, page_size=10000)
 
-    # Create CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
+    return StreamingResponse(
+        _stream_resources_csv(aggregator, filters),
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": "attachment; filename=aws_resources.csv",
+            # Tell nginx-style proxies not to rebuffer the stream
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+async def _stream_resources_csv(aggregator: ResourceAggregator, filters: ResourceFilters):
+    """Yield the CSV export one row at a time through a reused buffer."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
     writer.writerow([
         "Resource ID", "Type", "Name", "Region", "State", "Tags", "Monthly Cost"
     ])
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate(0)
 
-    for resource in result.items:
+    async for resource in aggregator.iter_resources(filters):
         writer.writerow([
             resource.resource_id,
             resource.resource_type,
@@ -106,13 +139,9 @@ async def export_resources_csv(
             json.dumps(resource.tags),
             resource.monthly_cost or "",
         ])
-
-    output.seek(0)
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=aws_resources.csv"},
-    )
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
 
 
 @router.get("/export/json")
@@ -121,13 +150,26 @@ async def export_resources_json(
     resource_type: Optional[str] = Query(None),
     region: Optional[str] = Query(None),
 ):
-    """Export resources as JSON."""
+    """Export resources as JSON, streamed one record at a time."""
     aggregator = ResourceAggregator()
     filters = ResourceFilters(resource_type=resource_type, region=region)
-    result = await aggregator.get_resources(filters=filters, page=1, page_size=10000)
 
-    return Response(
-        content=json.dumps([r.model_dump() for r in result.items], default=str),
+    return StreamingResponse(
+        _stream_resources_json(aggregator, filters),
         media_type="application/json",
-        headers={"Content-Disposition": "attachment; filename=aws_resources.json"},
+        headers={
+            "Content-Disposition": "attachment; filename=aws_resources.json",
+            "X-Accel-Buffering": "no",
+        },
     )
+
+
+async def _stream_resources_json(aggregator: ResourceAggregator, filters: ResourceFilters):
+    """Yield the JSON export as an array with one orjson-encoded element per row."""
+    yield b"["
+    first = True
+    async for resource in aggregator.iter_resources(filters):
+        doc = orjson.dumps(resource.model_dump(), default=str)
+        yield doc if first else b"," + doc
+        first = False
+    yield b"]"
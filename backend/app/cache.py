@@ -1,25 +1,49 @@
 """Redis cache management."""
 
-import json
-from datetime import datetime, date
+import time
 from typing import Any, Optional
 
+import orjson
 import redis.asyncio as redis
 
 from app.config import get_settings
 
+settings = get_settings()
 
-class DateTimeEncoder(json.JSONEncoder):
-    """JSON encoder that handles datetime objects."""
 
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        if isinstance(obj, date):
-            return obj.isoformat()
-        return super().default(obj)
+class _L1Cache:
+    """Tiny in-process TTL cache fronting Redis for hot keys.
 
-settings = get_settings()
+    Hits skip the Redis round-trip and the JSON parse entirely. Entries
+    are evicted in insertion order once full; the short TTL bounds how
+    long another worker's invalidation can be missed.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: dict[str, tuple[float, Any]] = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._data.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        if key not in self._data and len(self._data) >= self.maxsize:
+            self._data.pop(next(iter(self._data)))
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
 
 redis_client: Optional[redis.Redis] = None
 
@@ -27,10 +51,11 @@ redis_client: Optional[redis.Redis] = None
 async def init_cache():
     """Initialize Redis connection."""
     global redis_client
+    # Binary mode: payloads stay bytes end-to-end (orjson emits bytes),
+    # skipping a utf-8 transcode on every get/set
     redis_client = redis.from_url(
         settings.redis_url,
-        encoding="utf-8",
-        decode_responses=True,
+        decode_responses=False,
     )
 
 
@@ -55,42 +80,152 @@ class CacheService:
         self.client = client
         self.prefix = prefix
         self.default_ttl = settings.cache_ttl
+        self._l1 = _L1Cache(maxsize=1024, ttl=min(self.default_ttl, 60))
 
     def _make_key(self, key: str) -> str:
         """Create prefixed cache key."""
         return f"{self.prefix}:{key}"
 
+    def _dep_key(self, tag: str) -> str:
+        """Key of the Redis Set tracking cache keys tagged with `tag`."""
+        return self._make_key(f"deps:{tag}")
+
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
-        value = await self.client.get(self._make_key(key))
+        full_key = self._make_key(key)
+        cached = self._l1.get(full_key)
+        if cached is not None:
+            return cached
+
+        value = await self.client.get(full_key)
         if value:
-            return json.loads(value)
+            parsed = orjson.loads(value)
+            # Store the parsed object so an L1 hit skips the reparse too
+            self._l1.set(full_key, parsed)
+            return parsed
         return None
 
+    async def mget(self, keys: list[str]) -> list[Optional[Any]]:
+        """Get several values in one round-trip.
+
+        Handlers that load multiple independent cached sections (e.g. a
+        dashboard pulling summary + forecast + recommendations) should
+        batch through this instead of serial get() calls — one MGET
+        replaces N round-trips. L1 hits are filled locally and only the
+        misses go to Redis.
+        """
+        full_keys = [self._make_key(key) for key in keys]
+        values: list[Optional[Any]] = [self._l1.get(k) for k in full_keys]
+
+        missing = [i for i, value in enumerate(values) if value is None]
+        if not missing:
+            return values
+
+        raw = await self.client.mget([full_keys[i] for i in missing])
+        for i, payload in zip(missing, raw):
+            if payload:
+                parsed = orjson.loads(payload)
+                self._l1.set(full_keys[i], parsed)
+                values[i] = parsed
+        return values
+
     async def set(
-        self, key: str, value: Any, ttl: Optional[int] = None
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        tags: tuple[str, ...] = (),
     ) -> None:
-        """Set value in cache with optional TTL."""
-        await self.client.set(
-            self._make_key(key),
-            json.dumps(value, cls=DateTimeEncoder),
-            ex=ttl or self.default_ttl,
-        )
+        """Set value in cache with optional TTL.
+
+        Tags register the key in a reverse index (one Redis Set per
+        tag) so invalidation can target exactly the tracked keys
+        instead of scanning the keyspace.
+        """
+        full_key = self._make_key(key)
+        # orjson handles datetime/date natively; default=str covers the
+        # odd UUID or Decimal
+        payload = orjson.dumps(value, default=str)
+        expire = ttl or self.default_ttl
+        # L1 stores the canonical JSON round-trip so hits look identical
+        # to what a Redis read would have returned
+        self._l1.set(full_key, orjson.loads(payload))
+
+        if not tags:
+            await self.client.set(full_key, payload, ex=expire)
+            return
+
+        pipe = self.client.pipeline(transaction=False)
+        pipe.set(full_key, payload, ex=expire)
+        index_key = self._dep_key("index")
+        for tag in tags:
+            dep_key = self._dep_key(tag)
+            pipe.sadd(dep_key, full_key)
+            # The set must outlive its longest-lived member. NX seeds a
+            # TTL on a fresh set (GT alone never fires there — Redis
+            # treats "no TTL" as infinite, so GT would leave the set
+            # persistent forever); GT then only ever extends it.
+            pipe.expire(dep_key, expire, nx=True)
+            pipe.expire(dep_key, expire, gt=True)
+            pipe.sadd(index_key, dep_key)
+            # Same treatment for the index of dep sets, so it stays
+            # bounded too but never dies before a live member set
+            pipe.expire(index_key, expire, nx=True)
+            pipe.expire(index_key, expire, gt=True)
+        await pipe.execute()
 
     async def delete(self, key: str) -> None:
         """Delete key from cache."""
-        await self.client.delete(self._make_key(key))
+        full_key = self._make_key(key)
+        self._l1.delete(full_key)
+        await self.client.delete(full_key)
 
     async def delete_pattern(self, pattern: str) -> None:
-        """Delete all keys matching pattern."""
+        """Delete all keys matching pattern.
+
+        Walks the keyspace with SCAN instead of the blocking KEYS
+        command and frees matches in batches via UNLINK, which defers
+        the actual memory reclaim to a Redis background thread.
+        """
+        # Clearing all of L1 is cheaper than matching the pattern locally
+        self._l1.clear()
         full_pattern = self._make_key(pattern)
-        keys = await self.client.keys(full_pattern)
-        if keys:
-            await self.client.delete(*keys)
+        batch = []
+        async for key in self.client.scan_iter(match=full_pattern, count=500):
+            batch.append(key)
+            if len(batch) >= 500:
+                await self.client.unlink(*batch)
+                batch.clear()
+        if batch:
+            await self.client.unlink(*batch)
+
+    async def _invalidate_dep_sets(self, dep_keys: list[str]) -> None:
+        """UNLINK every key registered under the given dependency sets.
+
+        UNLINK frees memory asynchronously on the Redis side, so a
+        large invalidation does not block the server's event loop.
+        """
+        if not dep_keys:
+            return
+
+        self._l1.clear()
+        pipe = self.client.pipeline(transaction=False)
+        for dep_key in dep_keys:
+            pipe.smembers(dep_key)
+        member_sets = await pipe.execute()
+
+        keys = {key for members in member_sets for key in members}
+        await self.client.unlink(*keys, *dep_keys)
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        """Invalidate all cache entries registered under the given tags."""
+        await self._invalidate_dep_sets([self._dep_key(tag) for tag in tags])
 
     async def invalidate_resources(self, resource_type: Optional[str] = None):
         """Invalidate resource cache."""
         if resource_type:
-            await self.delete_pattern(f"resources:{resource_type}:*")
+            # Untyped list/detail entries may contain rows of this type
+            await self.invalidate_tags(f"resources:{resource_type}", "resources:all")
         else:
-            await self.delete_pattern("resources:*")
+            dep_keys = await self.client.smembers(self._dep_key("index"))
+            await self._invalidate_dep_sets(list(dep_keys))
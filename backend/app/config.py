@@ -1,6 +1,6 @@
 """Application configuration via Pydantic settings."""
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Optional
 
 from pydantic import Field, computed_field
@@ -40,12 +40,23 @@ class Settings(BaseSettings):
     aws_region: str = Field(default="us-east-1")
     aws_role_arn: Optional[str] = Field(default=None)
     aws_external_id: Optional[str] = Field(default=None)
+    # In-process TTL for aggregated resource fetches; bounds how stale
+    # the inventory listing can be between AWS fan-outs
+    aggregator_cache_ttl: int = Field(default=30)
 
     # Cognito
     cognito_user_pool_id: Optional[str] = Field(default=None)
     cognito_client_id: Optional[str] = Field(default=None)
     cognito_region: str = Field(default="us-east-1")
 
+    # Audit buffering
+    audit_flush_size: int = Field(default=500)
+    audit_flush_interval_ms: int = Field(default=30000)  # 30 seconds
+    # all | writes_only (skip dry runs) | failures_only
+    audit_level: str = Field(default="all")
+    # Monthly audit partitions older than this are dropped
+    audit_retention_days: int = Field(default=90)
+
     # Security
     admin_override_code: Optional[str] = Field(default=None)
     protected_tags_raw: str = Field(
@@ -59,14 +70,16 @@ class Settings(BaseSettings):
         validation_alias="CORS_ORIGINS"
     )
 
+    # cached_property: parsed once per Settings instance instead of
+    # splitting the raw string on every access
     @computed_field
-    @property
+    @cached_property
     def protected_tags(self) -> list[str]:
         """Parse comma-separated protected tags."""
         return [tag.strip() for tag in self.protected_tags_raw.split(",") if tag.strip()]
 
     @computed_field
-    @property
+    @cached_property
     def cors_origins(self) -> list[str]:
         """Parse comma-separated CORS origins."""
         return [origin.strip() for origin in self.cors_origins_raw.split(",") if origin.strip()]
@@ -1,21 +1,45 @@
 """Database connection and session management."""
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import NullPool
 
 from app.config import get_settings
 
 settings = get_settings()
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-)
+
+def _json_serializer(obj: Any) -> str:
+    """Serialize JSON column values with orjson (C-speed dumps)."""
+    return orjson.dumps(obj, default=str).decode()
+
+if "pgbouncer=true" in settings.database_url:
+    # PgBouncer in transaction mode does its own pooling; a client-side
+    # queue pool on top of it only adds stale-connection errors.
+    engine = create_async_engine(
+        settings.database_url,
+        echo=settings.debug,
+        poolclass=NullPool,
+        query_cache_size=500,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
+    )
+else:
+    engine = create_async_engine(
+        settings.database_url,
+        echo=settings.debug,
+        pool_pre_ping=True,
+        pool_size=20,
+        max_overflow=10,
+        pool_timeout=30,
+        pool_recycle=1800,
+        query_cache_size=500,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
+    )
 
 async_session_maker = async_sessionmaker(
     engine,
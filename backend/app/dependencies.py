@@ -1,41 +1,137 @@
 """FastAPI dependency injection."""
 
+from datetime import datetime
 from typing import Annotated
+from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi import Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.cache import get_cache, CacheService
 from app.models.database import User
+from app.services.audit import AuditService
 from app.services.auth import AuthService
+from app.services.aws.ec2 import EC2Service
+from app.services.aws.ecs import ECSService
+from app.services.aws.rds import RDSService
+from app.services.aws.s3 import S3Service
+from app.services.safety import SafetyService
 
-security = HTTPBearer()
 
+async def get_cache_service(request: Request) -> CacheService:
+    """Get the process-wide cache service created at startup."""
+    cache = getattr(request.app.state, "cache", None)
+    if cache is None:
+        # Fallback for processes that skip the lifespan handler
+        cache = CacheService(await get_cache())
+        request.app.state.cache = cache
+    return cache
 
-async def get_cache_service() -> CacheService:
-    """Get cache service instance."""
-    client = await get_cache()
-    return CacheService(client)
+
+def _app_service(request: Request, attr: str, factory):
+    """Fetch a lifespan-created singleton, creating it lazily if missing."""
+    service = getattr(request.app.state, attr, None)
+    if service is None:
+        service = factory()
+        setattr(request.app.state, attr, service)
+    return service
+
+
+def get_ec2_service(request: Request) -> EC2Service:
+    """Get the shared EC2 service instance."""
+    return _app_service(request, "ec2_service", EC2Service)
+
+
+def get_rds_service(request: Request) -> RDSService:
+    """Get the shared RDS service instance."""
+    return _app_service(request, "rds_service", RDSService)
+
+
+def get_ecs_service(request: Request) -> ECSService:
+    """Get the shared ECS service instance."""
+    return _app_service(request, "ecs_service", ECSService)
+
+
+def get_s3_service(request: Request) -> S3Service:
+    """Get the shared S3 service instance."""
+    return _app_service(request, "s3_service", S3Service)
+
+
+def get_safety_service(request: Request) -> SafetyService:
+    """Get the shared safety service instance."""
+    return _app_service(request, "safety_service", SafetyService)
+
+
+def get_audit_service(request: Request) -> AuditService:
+    """Get the shared audit service instance."""
+    return _app_service(request, "audit_service", AuditService)
+
+
+def get_auth_service(request: Request) -> AuthService:
+    """Get the shared auth service instance."""
+    return _app_service(request, "auth_service", AuthService)
+
+
+_USER_CACHE_TTL = 60
 
 
 async def get_current_user(
-    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    request: Request,
     db: Annotated[AsyncSession, Depends(get_db)],
+    auth_service: Annotated[AuthService, Depends(get_auth_service)],
+    cache: Annotated[CacheService, Depends(get_cache_service)],
 ) -> User:
     """Validate JWT and return current user."""
-    auth_service = AuthService()
-    token = credentials.credentials
+    # Read the header directly instead of going through HTTPBearer,
+    # which builds a credentials model per request just to carry the
+    # token string
+    authorization = request.headers.get("authorization", "")
+    if not authorization.startswith("Bearer "):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    token = authorization[7:]
 
     try:
         payload = await auth_service.verify_token(token)
+
+        # Serve the user row from cache for a short window; the SELECT
+        # per authenticated request goes away and a 60s TTL bounds how
+        # long a role change takes to propagate
+        cache_key = f"user:{payload['sub']}"
+        cached = await cache.get(cache_key)
+        if cached:
+            return User(
+                id=UUID(cached["id"]),
+                email=cached["email"],
+                cognito_sub=cached["cognito_sub"],
+                role=cached["role"],
+                created_at=datetime.fromisoformat(cached["created_at"]),
+                updated_at=datetime.fromisoformat(cached["updated_at"]),
+            )
+
         user = await auth_service.get_user_by_cognito_sub(db, payload["sub"])
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User not found",
             )
+
+        await cache.set(
+            cache_key,
+            {
+                "id": str(user.id),
+                "email": user.email,
+                "cognito_sub": user.cognito_sub,
+                "role": user.role,
+                "created_at": user.created_at.isoformat(),
+                "updated_at": user.updated_at.isoformat(),
+            },
+            ttl=_USER_CACHE_TTL,
+        )
         return user
     except Exception as e:
         raise HTTPException(
@@ -46,11 +142,13 @@ async def get_current_user(
 
 def require_role(*roles: str):
     """Dependency factory for role-based access control."""
+    # Hash lookup instead of a tuple scan on every authenticated request
+    allowed = frozenset(roles)
 
     async def role_checker(
         user: Annotated[User, Depends(get_current_user)]
     ) -> User:
-        if user.role not in roles:
+        if user.role not in allowed:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Role '{user.role}' not authorized. Required: {roles}",
@@ -4,12 +4,20 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from app.config import get_settings
 from app.api.routes import auth, resources, actions, cost, audit, accounts, health
 from app.database import init_db, close_db
-from app.cache import init_cache, close_cache
+from app.cache import init_cache, close_cache, get_cache, CacheService
+from app.services.audit import AuditService
+from app.services.auth import AuthService
+from app.services.aws.ec2 import EC2Service
+from app.services.aws.ecs import ECSService
+from app.services.aws.rds import RDSService
+from app.services.aws.s3 import S3Service
+from app.services.safety import SafetyService
 
 settings = get_settings()
 
@@ -20,8 +28,24 @@ async def lifespan(app: FastAPI):
     # Startup
     await init_db()
     await init_cache()
+    app.state.cache = CacheService(await get_cache())
+    # Service singletons: amortize botocore session/credential setup
+    # across requests instead of paying it in every handler
+    app.state.ec2_service = EC2Service()
+    app.state.rds_service = RDSService()
+    app.state.ecs_service = ECSService()
+    app.state.s3_service = S3Service()
+    app.state.safety_service = SafetyService()
+    app.state.audit_service = AuditService()
+    # Shared auth service keeps the JWKS fetched once per process;
+    # warming it here moves the Cognito round-trip off the first request
+    app.state.auth_service = AuthService()
+    await app.state.auth_service.warm_jwks()
+    # Audit rows are buffered in-process and flushed in batches
+    await app.state.audit_service.start()
     yield
     # Shutdown
+    await app.state.audit_service.stop()
     await close_db()
     await close_cache()
 
@@ -33,15 +57,23 @@ app = FastAPI(
     lifespan=lifespan,
     docs_url="/api/docs" if settings.debug else None,
     redoc_url="/api/redoc" if settings.debug else None,
+    default_response_class=ORJSONResponse,
 )
 
-# CORS middleware
+# Compress responses over 1 KB when the client accepts gzip; the
+# multi-MB CSV/JSON exports shrink ~10x and streaming bodies are
+# compressed chunk by chunk
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# CORS middleware. Explicit method/header lists let Starlette precompute
+# the Access-Control-Allow-* header values once at startup instead of
+# reflecting and joining wildcards on every preflight
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
+    allow_headers=["authorization", "content-type", "x-requested-with"],
 )
 
 
@@ -12,42 +12,19 @@ from sqlalchemy import (
     ForeignKey,
     JSON,
     TypeDecorator,
+    Uuid,
+    func,
 )
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB, INET
+from sqlalchemy.dialects.postgresql import JSONB, INET
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
-
-class UUID(TypeDecorator):
-    """Platform-independent UUID type.
-
-    Uses PostgreSQL's UUID type when available, otherwise uses String(36).
-    """
-    impl = String(36)
-    cache_ok = True
-
-    def load_dialect_impl(self, dialect):
-        if dialect.name == 'postgresql':
-            return dialect.type_descriptor(PG_UUID(as_uuid=True))
-        else:
-            return dialect.type_descriptor(String(36))
-
-    def process_bind_param(self, value, dialect):
-        if value is None:
-            return value
-        elif dialect.name == 'postgresql':
-            return value
-        else:
-            return str(value)
-
-    def process_result_value(self, value, dialect):
-        if value is None:
-            return value
-        elif isinstance(value, uuid.UUID):
-            return value
-        else:
-            return uuid.UUID(value)
+# SQLAlchemy's native Uuid type instead of a hand-rolled TypeDecorator:
+# on Postgres it rides asyncpg's binary UUID codec with no per-row
+# Python bind/result hops, and it still degrades to a character column
+# on other backends (the SQLite test database)
+UUID = Uuid
 
 
 class JSONType(TypeDecorator):
@@ -91,11 +68,12 @@ class User(Base):
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     cognito_sub: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     role: Mapped[str] = mapped_column(String(50), nullable=False, default="readonly")
+    # Database-side default: the timestamp never rides the INSERT wire
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now(), onupdate=datetime.utcnow
     )
 
     # Relationships
@@ -116,7 +94,7 @@ class AWSAccount(Base):
     external_id: Mapped[str] = mapped_column(String(255), nullable=True)
     enabled: Mapped[bool] = mapped_column(Boolean, default=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now()
     )
 
 
@@ -142,7 +120,7 @@ class AuditLog(Base):
     ip_address: Mapped[str] = mapped_column(IPAddressType(), nullable=True)
     user_agent: Mapped[str] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now()
     )
 
     # Relationships
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Any, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 
 
 # User schemas
@@ -22,8 +22,7 @@ class UserResponse(UserBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # AWS Account schemas
@@ -43,8 +42,7 @@ class AWSAccountResponse(AWSAccountBase):
     id: UUID
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Resource schemas
@@ -70,6 +68,9 @@ class ResourceListResponse(BaseModel):
     page: int
     page_size: int
     has_more: bool
+    # Keyset cursor for the next page; pass back as cursor/cursor_id
+    next_cursor: Optional[str] = None
+    next_cursor_id: Optional[str] = None
 
 
 class ResourceFilters(BaseModel):
@@ -186,8 +187,7 @@ class AuditLogResponse(BaseModel):
     response_data: Optional[dict] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AuditLogListResponse(BaseModel):
@@ -196,6 +196,9 @@ class AuditLogListResponse(BaseModel):
     page: int
     page_size: int
     has_more: bool
+    # Keyset cursor for the next page; pass back as cursor/cursor_id
+    next_cursor: Optional[datetime] = None
+    next_cursor_id: Optional[UUID] = None
 
 
 # Auth schemas
@@ -0,0 +1,16 @@
+"""Query construction helpers shared by the API routes."""
+
+from typing import Any
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import raiseload
+
+
+def select_with_raiseload(model: Any, *loads: Any) -> Select:
+    """Build a select with explicit relationship loading only.
+
+    Every relationship that will be accessed must be declared up front
+    (e.g. via ``selectinload``); anything else raises at query time
+    instead of silently fanning out into N+1 lazy loads.
+    """
+    return select(model).options(*loads, raiseload("*"))
@@ -1,8 +1,18 @@
 """Audit logging service."""
 
+import asyncio
+import hashlib
+import logging
+import re
+import uuid
+from datetime import datetime, timedelta
 from typing import Any, Optional
 
+import orjson
+from sqlalchemy import text
+
 from fastapi import Request
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import async_session_maker
@@ -11,11 +21,111 @@ from app.config import get_settings
 
 settings = get_settings()
 
+logger = logging.getLogger(__name__)
+
+# Built once so the flusher reuses the cached compiled form instead of
+# reconstructing the INSERT for every batch
+_AUDIT_INSERT = insert(AuditLog)
+
+# Monthly partitions as created by the partitioning migration
+_PARTITION_NAME_RE = re.compile(r"audit_logs_y(\d{4})m(\d{2})$")
+
 
 class AuditService:
     """Service for audit logging."""
 
-    async def log_action(
+    # Keys never persisted to the audit trail
+    _excluded_keys = frozenset({"override_code"})
+    # Resource-id lists longer than this are collapsed to a digest + count
+    _max_resource_ids = 100
+    # Insert column order shared by the COPY and INSERT paths
+    _row_columns = (
+        "user_id",
+        "action",
+        "resource_type",
+        "resource_id",
+        "aws_account_id",
+        "region",
+        "request_data",
+        "response_data",
+        "status",
+        "ip_address",
+        "user_agent",
+    )
+
+    def __init__(self) -> None:
+        # Bounded so a stalled database applies backpressure by falling
+        # back to direct writes instead of growing memory without limit
+        self._queue: asyncio.Queue[list[dict[str, Any]]] = asyncio.Queue(
+            maxsize=4096
+        )
+        self._flush_task: Optional[asyncio.Task] = None
+        self._maintenance_task: Optional[asyncio.Task] = None
+        # Strong references to QueueFull fallback writes; asyncio only
+        # holds tasks weakly, so an unreferenced task can be collected
+        # mid-flight — dropping rows exactly when the queue is full
+        self._fallback_tasks: set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        """Start the background loops (called from app lifespan)."""
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        if self._maintenance_task is None:
+            self._maintenance_task = asyncio.create_task(self._maintenance_loop())
+
+    async def stop(self) -> None:
+        """Stop the background loops and drain any buffered rows."""
+        for attr in ("_flush_task", "_maintenance_task"):
+            task = getattr(self, attr)
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+                setattr(self, attr, None)
+        if self._fallback_tasks:
+            # Let in-flight overflow writes finish before draining
+            await asyncio.gather(*self._fallback_tasks, return_exceptions=True)
+        await self._drain()
+
+    def _should_record(self, status: str) -> bool:
+        """Apply the configured audit level to an action status.
+
+        writes_only drops dry-run rows (exploratory UI clicks can flood
+        the table); failures_only keeps only failed actions. Real
+        mutations are always recorded under all and writes_only.
+        """
+        if settings.audit_level == "failures_only":
+            return status == "failed"
+        if settings.audit_level == "writes_only":
+            return status != "dry_run"
+        return True
+
+    def _trim_payload(
+        self, data: Optional[dict[str, Any]]
+    ) -> Optional[dict[str, Any]]:
+        """Trim an audit payload before persisting."""
+        if not data:
+            return data
+
+        trimmed = {}
+        for key, value in data.items():
+            if key in self._excluded_keys:
+                continue
+            if (
+                key == "resource_ids"
+                and isinstance(value, list)
+                and len(value) > self._max_resource_ids
+            ):
+                digest = hashlib.sha256(
+                    ",".join(str(v) for v in value).encode()
+                ).hexdigest()
+                value = {"count": len(value), "sha256": digest}
+            trimmed[key] = value
+        return trimmed
+
+    def _build_rows(
         self,
         user: Optional[User],
         action: str,
@@ -27,38 +137,396 @@ class AuditService:
         response_data: Optional[dict[str, Any]] = None,
         aws_account_id: Optional[str] = None,
         region: Optional[str] = None,
-    ) -> None:
-        """Log an action to the audit log."""
+    ) -> list[dict[str, Any]]:
+        """Build insert-ready audit rows for an action."""
         # Get client info
         ip_address = self._get_client_ip(request)
         user_agent = request.headers.get("user-agent", "")
 
+        # Drop secrets and oversized payloads before they hit the table
+        request_data = self._trim_payload(request_data)
+        response_data = self._trim_payload(response_data)
+
+        return [
+            {
+                "user_id": user.id if user else None,
+                "action": action,
+                "resource_type": resource_type,
+                "resource_id": resource_id,
+                "aws_account_id": aws_account_id or settings.aws_region,
+                "region": region or settings.aws_region,
+                "request_data": request_data,
+                "response_data": response_data,
+                "status": status,
+                "ip_address": ip_address,
+                "user_agent": user_agent,
+            }
+            for resource_id in resource_ids
+        ]
+
+    async def log_action(
+        self,
+        user: Optional[User],
+        action: str,
+        resource_type: str,
+        resource_ids: list[str],
+        request: Request,
+        status: str,
+        request_data: Optional[dict[str, Any]] = None,
+        response_data: Optional[dict[str, Any]] = None,
+        aws_account_id: Optional[str] = None,
+        region: Optional[str] = None,
+        session: Optional[AsyncSession] = None,
+    ) -> None:
+        """Log an action to the audit log immediately.
+
+        Callers that already hold a session (``Depends(get_db)``) can
+        pass it to skip a second pool checkout for the audit write.
+        """
+        rows = self._build_rows(
+            user=user,
+            action=action,
+            resource_type=resource_type,
+            resource_ids=resource_ids,
+            request=request,
+            status=status,
+            request_data=request_data,
+            response_data=response_data,
+            aws_account_id=aws_account_id,
+            region=region,
+        )
+        await self.log_actions_bulk(rows, session=session)
+
+    def enqueue_action(
+        self,
+        user: Optional[User],
+        action: str,
+        resource_type: str,
+        resource_ids: list[str],
+        request: Request,
+        status: str,
+        request_data: Optional[dict[str, Any]] = None,
+        response_data: Optional[dict[str, Any]] = None,
+        aws_account_id: Optional[str] = None,
+        region: Optional[str] = None,
+    ) -> None:
+        """Queue an audit entry for the background flusher.
+
+        Non-blocking: the handler returns without waiting for the
+        INSERT; rows are batched and written by the flush loop. When
+        the queue is full the entry is written directly instead of
+        being dropped.
+        """
+        if not self._should_record(status):
+            return
+        rows = self._build_rows(
+            user=user,
+            action=action,
+            resource_type=resource_type,
+            resource_ids=resource_ids,
+            request=request,
+            status=status,
+            request_data=request_data,
+            response_data=response_data,
+            aws_account_id=aws_account_id,
+            region=region,
+        )
+        try:
+            self._queue.put_nowait(rows)
+        except asyncio.QueueFull:
+            task = asyncio.get_running_loop().create_task(
+                self.log_actions_bulk(rows)
+            )
+            self._fallback_tasks.add(task)
+            task.add_done_callback(self._fallback_tasks.discard)
+
+    async def _flush_loop(self) -> None:
+        """Drain the queue in batches, flushing on size or interval."""
+        interval = settings.audit_flush_interval_ms / 1000
+        while True:
+            try:
+                rows = list(await asyncio.wait_for(self._queue.get(), interval))
+            except asyncio.TimeoutError:
+                continue
+            while (
+                len(rows) < settings.audit_flush_size
+                and not self._queue.empty()
+            ):
+                rows.extend(self._queue.get_nowait())
+            try:
+                await self.log_actions_bulk(rows)
+            except Exception:
+                # The audit trail must never take the flusher down with
+                # it — but a batch gets one more chance before it is
+                # dropped, and a drop is never silent
+                logger.exception(
+                    "audit flush failed; retrying batch of %d rows", len(rows)
+                )
+                try:
+                    await self.log_actions_bulk(rows)
+                except Exception:
+                    logger.exception(
+                        "audit flush retry failed; dropping %d rows", len(rows)
+                    )
+                continue
+
+    async def _maintenance_loop(self) -> None:
+        """Run partition maintenance daily."""
+        while True:
+            try:
+                await self.maintain_partitions()
+            except Exception:
+                # Retried on the next cycle; never kill the loop — but a
+                # failure here means partitions stop rolling, which must
+                # not go unnoticed
+                logger.exception("audit partition maintenance failed")
+            await asyncio.sleep(86400)
+
+    async def maintain_partitions(self) -> None:
+        """Create upcoming audit partitions and drop expired ones.
+
+        Retention cleanup is a DETACH + DROP of whole monthly
+        partitions (O(1)) rather than a DELETE over the parent table.
+        No-op on non-Postgres backends.
+        """
         async with async_session_maker() as session:
-            for resource_id in resource_ids:
-                log_entry = AuditLog(
-                    user_id=user.id if user else None,
-                    action=action,
-                    resource_type=resource_type,
-                    resource_id=resource_id,
-                    aws_account_id=aws_account_id or settings.aws_region,
-                    region=region or settings.aws_region,
-                    request_data=request_data,
-                    response_data=response_data,
-                    status=status,
-                    ip_address=ip_address,
-                    user_agent=user_agent,
+            if session.get_bind().dialect.name != "postgresql":
+                return
+
+            now = datetime.utcnow()
+            # Current and next month, so the rollover never lands in
+            # the default partition
+            months = [(now.year, now.month)]
+            months.append(
+                (now.year + 1, 1) if now.month == 12 else (now.year, now.month + 1)
+            )
+            for year, month in months:
+                await self._ensure_partition(session, year, month)
+
+            cutoff = now - timedelta(days=settings.audit_retention_days)
+            result = await session.execute(
+                text(
+                    "SELECT c.relname FROM pg_inherits i "
+                    "JOIN pg_class c ON c.oid = i.inhrelid "
+                    "WHERE i.inhparent = 'audit_logs'::regclass"
+                )
+            )
+            for (relname,) in result:
+                match = _PARTITION_NAME_RE.match(relname)
+                if not match:
+                    continue
+                year, month = int(match.group(1)), int(match.group(2))
+                # Partition upper bound: first day of the following month
+                upper = (
+                    datetime(year + 1, 1, 1)
+                    if month == 12
+                    else datetime(year, month + 1, 1)
                 )
-                session.add(log_entry)
+                if upper < cutoff:
+                    await session.execute(
+                        text(f"ALTER TABLE audit_logs DETACH PARTITION {relname}")
+                    )
+                    await session.execute(text(f"DROP TABLE {relname}"))
 
+            # Rows stranded in the default partition never match the
+            # monthly-partition name pattern, so expire them by date or
+            # retention silently stops applying to them
+            default_exists = await session.scalar(
+                text("SELECT to_regclass('audit_logs_default')")
+            )
+            if default_exists:
+                result = await session.execute(
+                    text(
+                        "DELETE FROM audit_logs_default "
+                        "WHERE created_at < :cutoff"
+                    ),
+                    {"cutoff": cutoff},
+                )
+                if result.rowcount:
+                    logger.warning(
+                        "purged %d expired audit rows from the default "
+                        "partition; a month's partition was likely missing "
+                        "when they were written",
+                        result.rowcount,
+                    )
+                # Heal unexpired strays by creating their months'
+                # partitions, which migrates the rows out of the default
+                stray_months = await session.execute(
+                    text(
+                        "SELECT DISTINCT "
+                        "date_part('year', created_at)::int, "
+                        "date_part('month', created_at)::int "
+                        "FROM audit_logs_default"
+                    )
+                )
+                for year, month in stray_months:
+                    await self._ensure_partition(session, year, month)
             await session.commit()
 
+    async def _ensure_partition(
+        self, session: AsyncSession, year: int, month: int
+    ) -> None:
+        """Create a month's partition, evacuating the default first.
+
+        Postgres rejects CREATE ... PARTITION OF while the default
+        partition holds rows for the month, so any strays get moved
+        into the new partition under a brief detach of the default.
+        """
+        name = f"audit_logs_y{year}m{month:02d}"
+        exists = await session.scalar(
+            text("SELECT to_regclass(:name)"), {"name": name}
+        )
+        if exists:
+            return
+
+        next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+        lower = f"{year}-{month:02d}-01"
+        upper = f"{next_year}-{next_month:02d}-01"
+
+        stranded = await session.scalar(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM audit_logs_default "
+                f"WHERE created_at >= '{lower}' AND created_at < '{upper}')"
+            )
+        )
+        if stranded:
+            await session.execute(
+                text("ALTER TABLE audit_logs DETACH PARTITION audit_logs_default")
+            )
+            await session.execute(
+                text(
+                    f"CREATE TABLE {name} PARTITION OF audit_logs "
+                    f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+                )
+            )
+            await session.execute(
+                text(
+                    "INSERT INTO audit_logs SELECT * FROM audit_logs_default "
+                    f"WHERE created_at >= '{lower}' AND created_at < '{upper}'"
+                )
+            )
+            await session.execute(
+                text(
+                    "DELETE FROM audit_logs_default "
+                    f"WHERE created_at >= '{lower}' AND created_at < '{upper}'"
+                )
+            )
+            await session.execute(
+                text(
+                    "ALTER TABLE audit_logs "
+                    "ATTACH PARTITION audit_logs_default DEFAULT"
+                )
+            )
+        else:
+            await session.execute(
+                text(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF audit_logs "
+                    f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+                )
+            )
+
+    async def _drain(self) -> None:
+        """Flush everything still buffered (shutdown hook)."""
+        rows: list[dict[str, Any]] = []
+        while not self._queue.empty():
+            rows.extend(self._queue.get_nowait())
+        if rows:
+            await self.log_actions_bulk(rows)
+
+    async def log_actions_bulk(
+        self,
+        rows: list[dict[str, Any]],
+        session: Optional[AsyncSession] = None,
+    ) -> None:
+        """Insert a batch of audit rows in a single operation.
+
+        Uses asyncpg's COPY protocol against Postgres, which skips
+        per-row statement overhead entirely; other backends get one
+        multi-row INSERT. When ``session`` is given the rows ride the
+        caller's connection instead of checking a second one out of
+        the pool.
+        """
+        if not rows:
+            return
+
+        normalized = [
+            {
+                column: (
+                    self._format_exception(row.get(column))
+                    if column in ("request_data", "response_data")
+                    else row.get(column)
+                )
+                for column in self._row_columns
+            }
+            for row in rows
+        ]
+
+        if session is not None:
+            await self._insert_rows(session, normalized)
+            await session.commit()
+            return
+
+        async with async_session_maker() as session:
+            await self._insert_rows(session, normalized)
+            await session.commit()
+
+    async def _insert_rows(
+        self, session: AsyncSession, rows: list[dict[str, Any]]
+    ) -> None:
+        """Write normalized rows through the fastest path the driver has."""
+        if session.get_bind().dialect.driver == "asyncpg":
+            await self._copy_rows(session, rows)
+        else:
+            await session.execute(_AUDIT_INSERT, rows)
+
+    @staticmethod
+    def _format_exception(data: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
+        """Expand deferred exception payloads ({"exc": e}) at flush time.
+
+        Handlers enqueue the exception object itself so the (possibly
+        large) str() formatting happens in the flusher, off the
+        request path.
+        """
+        if isinstance(data, dict) and isinstance(data.get("exc"), BaseException):
+            exc = data["exc"]
+            return {"error": str(exc), "error_type": type(exc).__name__}
+        return data
+
+    async def _copy_rows(
+        self, session: AsyncSession, rows: list[dict[str, Any]]
+    ) -> None:
+        """COPY rows straight into audit_logs via the asyncpg driver."""
+        connection = await session.connection()
+        raw = await connection.get_raw_connection()
+        driver_connection = raw.driver_connection
+
+        records = [
+            (
+                uuid.uuid4(),
+                *(
+                    orjson.dumps(row[column], default=str).decode()
+                    if column in ("request_data", "response_data") and row[column]
+                    else row[column]
+                    for column in self._row_columns
+                ),
+                datetime.utcnow(),
+            )
+            for row in rows
+        ]
+        await driver_connection.copy_records_to_table(
+            "audit_logs",
+            records=records,
+            columns=["id", *self._row_columns, "created_at"],
+        )
+
     def _get_client_ip(self, request: Request) -> Optional[str]:
         """Extract client IP from request."""
         # Check for forwarded headers (behind proxy/load balancer)
         forwarded = request.headers.get("x-forwarded-for")
         if forwarded:
-            # Take the first IP in the chain
-            return forwarded.split(",")[0].strip()
+            # Take the first IP in the chain; partition stops at the
+            # first comma instead of splitting the whole header
+            return forwarded.partition(",")[0].strip()
 
         real_ip = request.headers.get("x-real-ip")
         if real_ip:
@@ -77,10 +545,15 @@ class AuditService:
     ) -> list[AuditLog]:
         """Get recent audit logs for a resource."""
         from sqlalchemy import select, desc
+        from sqlalchemy.orm import selectinload
 
         async with async_session_maker() as session:
+            # Eager-load the user relation: the session closes before the
+            # caller reads the rows, so a lazy load would either raise on
+            # the detached instance or cost a SELECT per row
             query = (
                 select(AuditLog)
+                .options(selectinload(AuditLog.user))
                 .where(AuditLog.resource_id == resource_id)
                 .order_by(desc(AuditLog.created_at))
                 .limit(limit)
@@ -95,10 +568,12 @@ class AuditService:
     ) -> list[AuditLog]:
         """Get recent actions by a user."""
         from sqlalchemy import select, desc
+        from sqlalchemy.orm import selectinload
 
         async with async_session_maker() as session:
             query = (
                 select(AuditLog)
+                .options(selectinload(AuditLog.user))
                 .where(AuditLog.user_id == user_id)
                 .order_by(desc(AuditLog.created_at))
                 .limit(limit)
@@ -1,11 +1,14 @@
 """Authentication service for Cognito integration."""
 
-import json
+import asyncio
+import hashlib
+import time
 from typing import Any, Optional
 
 import httpx
-from jose import jwt, JWTError
+from jose import jwk, jwt, JWTError
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
@@ -17,11 +20,25 @@ settings = get_settings()
 class AuthService:
     """Service for authentication with AWS Cognito."""
 
+    # Verified payloads are cached briefly so a client hammering the API
+    # with the same token pays the RS256 check once per window
+    _token_cache_ttl = 30
+    _token_cache_max = 10000
+    # Floor between JWKS refetches triggered by unknown kids, so bogus
+    # tokens cannot hammer Cognito
+    _jwks_refresh_min_interval = 60
+
     def __init__(self):
         self.user_pool_id = settings.cognito_user_pool_id
         self.client_id = settings.cognito_client_id
         self.region = settings.cognito_region
-        self._jwks = None
+        # Signing keys by kid, constructed once per process; the lock
+        # keeps a login storm on cold start to a single JWKS fetch
+        self._jwks_keys: Optional[dict[str, Any]] = None
+        self._jwks_lock = asyncio.Lock()
+        self._jwks_fetched_at = 0.0
+        # token digest -> (expires_at, payload)
+        self._token_cache: dict[str, tuple[float, dict[str, Any]]] = {}
 
     @property
     def issuer(self) -> str:
@@ -33,14 +50,56 @@ class AuthService:
         """Get the JWKS URL."""
         return f"{self.issuer}/.well-known/jwks.json"
 
-    async def _get_jwks(self) -> dict:
-        """Fetch and cache JWKS from Cognito."""
-        if self._jwks is None:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.jwks_url)
-                response.raise_for_status()
-                self._jwks = response.json()
-        return self._jwks
+    async def warm_jwks(self) -> None:
+        """Fetch the JWKS ahead of the first authenticated request.
+
+        Called from the lifespan handler so the first login after a
+        deploy does not pay the Cognito round-trip. Failures are left
+        for the first verify to retry — startup must not depend on
+        Cognito being reachable.
+        """
+        if not self.user_pool_id:
+            return
+        try:
+            async with self._jwks_lock:
+                await self._load_jwks()
+        except Exception:
+            pass
+
+    async def _load_jwks(self) -> None:
+        """Fetch the JWKS and build signing keys. Caller holds the lock."""
+        async with httpx.AsyncClient() as client:
+            response = await client.get(self.jwks_url)
+            response.raise_for_status()
+            jwks = response.json()
+        self._jwks_keys = {k["kid"]: jwk.construct(k) for k in jwks.get("keys", [])}
+        self._jwks_fetched_at = time.monotonic()
+
+    async def _get_signing_key(self, kid: str) -> Optional[Any]:
+        """Get the pre-built signing key for a key ID.
+
+        The JWKS document is fetched once and its keys constructed up
+        front, so per-request verification is a dict lookup instead of
+        a fetch, a list scan and a key parse. An unknown kid triggers
+        one rate-limited refetch to pick up Cognito key rotation.
+        """
+        if self._jwks_keys is None:
+            async with self._jwks_lock:
+                if self._jwks_keys is None:
+                    await self._load_jwks()
+
+        key = self._jwks_keys.get(kid)
+        if key is None and (
+            time.monotonic() - self._jwks_fetched_at > self._jwks_refresh_min_interval
+        ):
+            async with self._jwks_lock:
+                if (
+                    time.monotonic() - self._jwks_fetched_at
+                    > self._jwks_refresh_min_interval
+                ):
+                    await self._load_jwks()
+            key = self._jwks_keys.get(kid)
+        return key
 
     async def verify_token(self, token: str) -> dict[str, Any]:
         """Verify a JWT token from Cognito."""
@@ -48,26 +107,26 @@ class AuthService:
             # Development mode - return mock payload
             return {"sub": "dev-user", "email": "dev@example.com"}
 
-        try:
-            # Get JWKS
-            jwks = await self._get_jwks()
+        cache_key = hashlib.sha256(token.encode()).hexdigest()[:32]
+        now = time.time()
+        cached = self._token_cache.get(cache_key)
+        if cached and cached[0] > now:
+            return cached[1]
 
+        try:
             # Decode header without verification to get key ID
             unverified_header = jwt.get_unverified_header(token)
             kid = unverified_header.get("kid")
 
-            # Find matching key
-            key = None
-            for k in jwks.get("keys", []):
-                if k.get("kid") == kid:
-                    key = k
-                    break
-
+            key = await self._get_signing_key(kid)
             if not key:
                 raise ValueError("Public key not found in JWKS")
 
-            # Verify and decode token
-            payload = jwt.decode(
+            # Verify and decode token. The RSA modexp is pure CPU work,
+            # so run it on a worker thread rather than stalling the
+            # event loop — only cache misses pay this path at all
+            payload = await asyncio.to_thread(
+                jwt.decode,
                 token,
                 key,
                 algorithms=["RS256"],
@@ -75,6 +134,17 @@ class AuthService:
                 issuer=self.issuer,
             )
 
+            # Cache until the window closes or shortly before the token
+            # itself expires, whichever comes first
+            ttl = min(self._token_cache_ttl, payload.get("exp", now) - now - 5)
+            if ttl > 0:
+                if (
+                    cache_key not in self._token_cache
+                    and len(self._token_cache) >= self._token_cache_max
+                ):
+                    self._token_cache.pop(next(iter(self._token_cache)))
+                self._token_cache[cache_key] = (now + ttl, payload)
+
             return payload
 
         except JWTError as e:
@@ -168,17 +238,22 @@ class AuthService:
         email: str,
         role: str = "readonly",
     ) -> User:
-        """Get existing user or create new one."""
-        user = await self.get_user_by_cognito_sub(db, cognito_sub)
-
-        if not user:
-            user = User(
-                cognito_sub=cognito_sub,
-                email=email,
-                role=role,
-            )
-            db.add(user)
-            await db.commit()
-            await db.refresh(user)
+        """Get existing user or create new one.
 
+        Single upsert round-trip on the cognito_sub unique constraint —
+        race-free under concurrent first logins, and keeps the stored
+        email in sync with Cognito on the way through.
+        """
+        stmt = (
+            pg_insert(User)
+            .values(cognito_sub=cognito_sub, email=email, role=role)
+            .on_conflict_do_update(
+                index_elements=["cognito_sub"],
+                set_={"email": email},
+            )
+            .returning(User)
+        )
+        result = await db.execute(stmt)
+        user = result.scalar_one()
+        await db.commit()
         return user
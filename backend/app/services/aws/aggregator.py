@@ -1,7 +1,9 @@
 """Resource aggregator service for combining resources from multiple services."""
 
 import asyncio
-from typing import Optional
+import heapq
+import time
+from typing import AsyncIterator, Optional
 
 from app.models.schemas import ResourceResponse, ResourceListResponse, ResourceFilters
 from app.services.aws.ec2 import EC2Service
@@ -14,19 +16,59 @@ from app.config import get_settings
 settings = get_settings()
 
 
+# Aggregated fetch results shared across requests for a short window:
+# browsing pages 1→2→3 of the same listing hits memory instead of
+# re-firing the whole AWS fan-out each time. Keyed by (regions, resource
+# types); per-key locks coalesce concurrent misses into one fetch.
+_FETCH_CACHE: dict[
+    tuple[tuple[str, ...], tuple[str, ...]], tuple[float, list[ResourceResponse]]
+] = {}
+_FETCH_LOCKS: dict[tuple[tuple[str, ...], tuple[str, ...]], asyncio.Lock] = {}
+
+# Cap on concurrent per-region service fetches in multi-region mode, so
+# scanning a whole account does not open an unbounded number of sockets
+_FETCH_CONCURRENCY = 32
+
+
+def invalidate_fetch_cache() -> None:
+    """Drop cached aggregations after a mutating action."""
+    _FETCH_CACHE.clear()
+
+
+def _sort_key(resource: ResourceResponse) -> tuple[str, str]:
+    """Display-order sort key; the resource_id tiebreak makes it unique,
+    which keyset cursors depend on."""
+    return (resource.name or resource.resource_id, resource.resource_id)
+
+
 class ResourceAggregator:
     """Aggregates resources from multiple AWS services."""
 
-    def __init__(self, region: Optional[str] = None):
+    def __init__(
+        self,
+        region: Optional[str] = None,
+        regions: Optional[list[str]] = None,
+    ):
         self.region = region or settings.aws_region
+        # Multi-region mode: the same fetches fan out across every
+        # region concurrently (e.g. regions=await service.list_regions())
+        self.regions = list(regions) if regions else [self.region]
 
     async def get_resources(
         self,
         filters: ResourceFilters,
         page: int = 1,
         page_size: int = 50,
+        cursor: Optional[str] = None,
+        cursor_id: Optional[str] = None,
     ) -> ResourceListResponse:
-        """Get all resources matching filters with pagination."""
+        """Get all resources matching filters with pagination.
+
+        Supports both offset pagination (page/page_size) and keyset
+        pagination (cursor = last item's sort name, cursor_id = its
+        resource_id). Either way only the needed prefix is selected with
+        a bounded heap instead of sorting the whole filtered set.
+        """
         # Determine which services to query
         resource_types = self._get_resource_types(filters.resource_type)
 
@@ -35,24 +77,56 @@ class ResourceAggregator:
 
         # Apply filters
         filtered = self._apply_filters(all_resources, filters)
-
-        # Sort by name/id
-        filtered.sort(key=lambda r: r.name or r.resource_id)
-
-        # Paginate
         total = len(filtered)
-        start = (page - 1) * page_size
-        end = start + page_size
-        paginated = filtered[start:end]
+
+        if cursor is not None and cursor_id is not None:
+            # Keyset mode: only items past the anchor compete, and the
+            # heap keeps just page_size of them — a deep page costs the
+            # same as page one
+            anchor = (cursor, cursor_id)
+            after = [r for r in filtered if _sort_key(r) > anchor]
+            paginated = heapq.nsmallest(page_size, after, key=_sort_key)
+            has_more = len(after) > page_size
+        else:
+            # Offset mode: select the first page*page_size items in
+            # O(N log end) rather than fully sorting N
+            end = page * page_size
+            top = heapq.nsmallest(end, filtered, key=_sort_key)
+            paginated = top[end - page_size:]
+            has_more = end < total
+
+        next_cursor = next_cursor_id = None
+        if paginated and has_more:
+            last = paginated[-1]
+            next_cursor = last.name or last.resource_id
+            next_cursor_id = last.resource_id
 
         return ResourceListResponse(
             items=paginated,
             total=total,
             page=page,
             page_size=page_size,
-            has_more=end < total,
+            has_more=has_more,
+            next_cursor=next_cursor,
+            next_cursor_id=next_cursor_id,
         )
 
+    async def iter_resources(
+        self, filters: ResourceFilters
+    ) -> AsyncIterator[ResourceResponse]:
+        """Yield every resource matching filters, sorted, unpaginated.
+
+        Lets callers (exports) consume rows one at a time instead of
+        going through the paginated list response.
+        """
+        resource_types = self._get_resource_types(filters.resource_type)
+        all_resources = await self._fetch_all_resources(resource_types)
+        filtered = self._apply_filters(all_resources, filters)
+        # sorted() rather than .sort(): with no active filters this is
+        # the shared cached list, which must stay unmutated
+        for resource in sorted(filtered, key=_sort_key):
+            yield resource
+
     def _get_resource_types(self, filter_type: Optional[str]) -> list[str]:
         """Get list of resource types to query."""
         all_types = ["ec2", "ebs", "rds", "s3", "ecs", "lambda"]
@@ -67,21 +141,61 @@ class ResourceAggregator:
     async def _fetch_all_resources(
         self, resource_types: list[str]
     ) -> list[ResourceResponse]:
-        """Fetch resources from all specified services concurrently."""
-        tasks = []
+        """Fetch resources for the given types, serving repeats from memory.
+
+        Callers must not mutate the returned list — it is shared across
+        requests until the TTL expires.
+        """
+        key = (tuple(self.regions), tuple(resource_types))
+        cached = _FETCH_CACHE.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        lock = _FETCH_LOCKS.setdefault(key, asyncio.Lock())
+        async with lock:
+            # A concurrent request may have filled the entry while this
+            # one waited; only the first holder pays the fan-out
+            cached = _FETCH_CACHE.get(key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+
+            resources = await self._fetch_from_aws(resource_types)
+            _FETCH_CACHE[key] = (
+                time.monotonic() + settings.aggregator_cache_ttl,
+                resources,
+            )
+            return resources
+
+    async def _fetch_from_aws(
+        self, resource_types: list[str]
+    ) -> list[ResourceResponse]:
+        """Fetch resources from all services and regions concurrently.
 
-        if "ec2" in resource_types:
-            tasks.append(self._fetch_ec2())
-        if "ebs" in resource_types:
-            tasks.append(self._fetch_ebs())
-        if "rds" in resource_types:
-            tasks.append(self._fetch_rds())
-        if "s3" in resource_types:
-            tasks.append(self._fetch_s3())
-        if "ecs" in resource_types:
-            tasks.append(self._fetch_ecs())
-        if "lambda" in resource_types:
-            tasks.append(self._fetch_lambda())
+        Every (service, region) pair runs as its own task under a
+        semaphore, so a whole-account scan across many regions costs
+        roughly one round-trip of wall clock without opening an
+        unbounded number of connections.
+        """
+        semaphore = asyncio.Semaphore(_FETCH_CONCURRENCY)
+
+        async def bounded(coro):
+            async with semaphore:
+                return await coro
+
+        tasks = []
+        for region in self.regions:
+            if "ec2" in resource_types:
+                tasks.append(bounded(self._fetch_ec2(region)))
+            if "ebs" in resource_types:
+                tasks.append(bounded(self._fetch_ebs(region)))
+            if "rds" in resource_types:
+                tasks.append(bounded(self._fetch_rds(region)))
+            if "s3" in resource_types:
+                tasks.append(bounded(self._fetch_s3(region)))
+            if "ecs" in resource_types:
+                tasks.append(bounded(self._fetch_ecs(region)))
+            if "lambda" in resource_types:
+                tasks.append(bounded(self._fetch_lambda(region)))
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -94,43 +208,50 @@ class ResourceAggregator:
 
         return all_resources
 
-    async def _fetch_ec2(self) -> list[ResourceResponse]:
+    async def _fetch_ec2(self, region: str) -> list[ResourceResponse]:
         """Fetch EC2 instances."""
-        service = EC2Service(region=self.region)
+        service = EC2Service(region=region)
         return await service.list_instances()
 
-    async def _fetch_ebs(self) -> list[ResourceResponse]:
+    async def _fetch_ebs(self, region: str) -> list[ResourceResponse]:
         """Fetch EBS volumes."""
-        service = EC2Service(region=self.region)
+        service = EC2Service(region=region)
         return await service.list_volumes()
 
-    async def _fetch_rds(self) -> list[ResourceResponse]:
+    async def _fetch_rds(self, region: str) -> list[ResourceResponse]:
         """Fetch RDS instances."""
-        service = RDSService(region=self.region)
-        instances = await service.list_instances()
-        clusters = await service.list_clusters()
+        service = RDSService(region=region)
+        # Instances and clusters are independent calls; overlap them so
+        # the fetch costs max(latency) instead of the sum
+        instances, clusters = await asyncio.gather(
+            service.list_instances(), service.list_clusters()
+        )
         return instances + clusters
 
-    async def _fetch_s3(self) -> list[ResourceResponse]:
+    async def _fetch_s3(self, region: str) -> list[ResourceResponse]:
         """Fetch S3 buckets."""
-        service = S3Service(region=self.region)
+        service = S3Service(region=region)
         return await service.list_buckets()
 
-    async def _fetch_ecs(self) -> list[ResourceResponse]:
+    async def _fetch_ecs(self, region: str) -> list[ResourceResponse]:
         """Fetch ECS services."""
-        service = ECSService(region=self.region)
+        service = ECSService(region=region)
         clusters = await service.list_clusters()
 
+        # One list_services call per cluster, all in flight at once
+        per_cluster = await asyncio.gather(
+            *(service.list_services(cluster) for cluster in clusters)
+        )
+
         all_services = []
-        for cluster in clusters:
-            services = await service.list_services(cluster)
+        for services in per_cluster:
             all_services.extend(services)
 
         return all_services
 
-    async def _fetch_lambda(self) -> list[ResourceResponse]:
+    async def _fetch_lambda(self, region: str) -> list[ResourceResponse]:
         """Fetch Lambda functions."""
-        service = LambdaService(region=self.region)
+        service = LambdaService(region=region)
         return await service.list_functions()
 
     def _apply_filters(
@@ -138,36 +259,46 @@ class ResourceAggregator:
         resources: list[ResourceResponse],
         filters: ResourceFilters,
     ) -> list[ResourceResponse]:
-        """Apply filters to resource list."""
-        filtered = resources
+        """Apply filters to resource list in a single pass.
+
+        One predicate per active filter, all evaluated in one walk over
+        the list — the chained per-filter comprehensions this replaces
+        allocated a fresh intermediate list per filter and rescanned the
+        survivors each time.
+        """
+        preds = []
 
         if filters.resource_type:
-            filtered = [r for r in filtered if r.resource_type == filters.resource_type]
+            resource_type = filters.resource_type
+            preds.append(lambda r: r.resource_type == resource_type)
 
         if filters.region:
-            filtered = [r for r in filtered if r.region == filters.region]
+            region = filters.region
+            preds.append(lambda r: r.region == region)
 
         if filters.state:
-            filtered = [r for r in filtered if r.state == filters.state]
+            state = filters.state
+            preds.append(lambda r: r.state == state)
 
         if filters.tag_key:
-            if filters.tag_value:
-                filtered = [
-                    r for r in filtered
-                    if r.tags.get(filters.tag_key) == filters.tag_value
-                ]
+            tag_key = filters.tag_key
+            tag_value = filters.tag_value
+            if tag_value:
+                preds.append(lambda r: r.tags.get(tag_key) == tag_value)
             else:
-                filtered = [r for r in filtered if filters.tag_key in r.tags]
+                preds.append(lambda r: tag_key in r.tags)
 
         if filters.search:
             search_lower = filters.search.lower()
-            filtered = [
-                r for r in filtered
-                if search_lower in r.resource_id.lower()
-                or (r.name and search_lower in r.name.lower())
-            ]
+            preds.append(
+                lambda r: search_lower in r.resource_id.lower()
+                or (r.name is not None and search_lower in r.name.lower())
+            )
 
-        return filtered
+        if not preds:
+            return resources
+
+        return [r for r in resources if all(p(r) for p in preds)]
 
     async def get_resource_by_id(self, resource_id: str) -> Optional[ResourceResponse]:
         """Get a specific resource by its ID."""
@@ -187,21 +318,20 @@ class ResourceAggregator:
                 service = ECSService(region=self.region)
                 return await service.get_service(parts[0], parts[1])
         elif not resource_id.startswith(("arn:", "i-", "vol-")):
-            # Could be RDS, S3, or Lambda
-            # Try each service
+            # Could be RDS, S3, or Lambda — try all three at once and
+            # keep the first hit in the old precedence order, so the
+            # worst case costs one round-trip instead of three
             rds = RDSService(region=self.region)
-            rds_instance = await rds.get_instance(resource_id)
-            if rds_instance:
-                return rds_instance
-
             s3 = S3Service(region=self.region)
-            bucket = await s3.get_bucket(resource_id)
-            if bucket:
-                return bucket
-
             lambda_svc = LambdaService(region=self.region)
-            func = await lambda_svc.get_function(resource_id)
-            if func:
-                return func
+            candidates = await asyncio.gather(
+                rds.get_instance(resource_id),
+                s3.get_bucket(resource_id),
+                lambda_svc.get_function(resource_id),
+                return_exceptions=True,
+            )
+            for candidate in candidates:
+                if candidate and not isinstance(candidate, BaseException):
+                    return candidate
 
         return None
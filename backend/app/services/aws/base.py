@@ -1,6 +1,8 @@
 """Base AWS service with common functionality."""
 
 import asyncio
+import time
+from functools import lru_cache
 from typing import Any, AsyncGenerator, Optional
 
 import aioboto3
@@ -10,6 +12,52 @@ from app.config import get_settings
 
 settings = get_settings()
 
+# One session and client config for the whole process. Each
+# aioboto3.Session carries its own credential resolver chain, endpoint
+# data loader and event system; the aggregator builds six service
+# objects per request, so per-instance sessions multiplied all of that
+# setup. max_pool_connections is raised from the default 10 so the
+# concurrent fan-out in the aggregator does not queue on the connection
+# pool.
+_SESSION = aioboto3.Session()
+_CONFIG = Config(
+    retries={"max_attempts": 3, "mode": "adaptive"},
+    connect_timeout=5,
+    read_timeout=30,
+    max_pool_connections=50,
+)
+
+# Assumed-role credentials shared across all service instances, keyed by
+# (role_arn, external_id). A single aggregation fans out to half a dozen
+# services, each of which would otherwise pay its own sts.assume_role
+# round-trip for the same role. Credentials are reused until five
+# minutes before their STS expiry; the lock collapses concurrent misses
+# into one assume_role call.
+_STS_CREDENTIALS: dict[tuple[str, Optional[str]], dict[str, Any]] = {}
+_STS_LOCK = asyncio.Lock()
+_STS_EXPIRY_MARGIN = 300
+
+
+@lru_cache(maxsize=8192)
+def _parse_arn(arn: str) -> dict[str, str]:
+    """Split an ARN into its components.
+
+    maxsplit keeps the resource portion (which may itself contain
+    colons) intact instead of splitting it and joining it back, and
+    the LRU cache absorbs the repeats ARNs show across list and detail
+    responses. Callers must treat the returned dict as read-only.
+    """
+    _, partition, service, region, account, resource = (
+        arn.split(":", 5) + [""] * 6
+    )[:6]
+    return {
+        "partition": partition,
+        "service": service,
+        "region": region,
+        "account": account,
+        "resource": resource,
+    }
+
 
 class AWSBaseService:
     """Base class for AWS service operations."""
@@ -23,17 +71,43 @@ class AWSBaseService:
         self.region = region or settings.aws_region
         self.role_arn = role_arn or settings.aws_role_arn
         self.external_id = external_id or settings.aws_external_id
-        self.session = aioboto3.Session()
-        self.config = Config(
-            retries={"max_attempts": 3, "mode": "adaptive"},
-            connect_timeout=5,
-            read_timeout=30,
-        )
+        self.session = _SESSION
+        self.config = _CONFIG
 
     async def get_client(self, service_name: str):
         """Get async boto3 client for a service."""
         if self.role_arn:
             # Assume role for cross-account access
+            credentials = await self._get_role_credentials()
+            return self.session.client(
+                service_name,
+                region_name=self.region,
+                config=self.config,
+                aws_access_key_id=credentials["AccessKeyId"],
+                aws_secret_access_key=credentials["SecretAccessKey"],
+                aws_session_token=credentials["SessionToken"],
+            )
+        else:
+            # Use default credentials
+            return self.session.client(
+                service_name,
+                region_name=self.region,
+                config=self.config,
+            )
+
+    async def _get_role_credentials(self) -> dict[str, Any]:
+        """Get assumed-role credentials, reusing them until near expiry."""
+        key = (self.role_arn, self.external_id)
+        now = time.time()
+        cached = _STS_CREDENTIALS.get(key)
+        if cached and cached["Expiration"].timestamp() - _STS_EXPIRY_MARGIN > now:
+            return cached
+
+        async with _STS_LOCK:
+            cached = _STS_CREDENTIALS.get(key)
+            if cached and cached["Expiration"].timestamp() - _STS_EXPIRY_MARGIN > now:
+                return cached
+
             async with self.session.client(
                 "sts",
                 region_name=self.region,
@@ -48,23 +122,10 @@ class AWSBaseService:
                     assume_kwargs["ExternalId"] = self.external_id
 
                 response = await sts.assume_role(**assume_kwargs)
-                credentials = response["Credentials"]
-
-                return self.session.client(
-                    service_name,
-                    region_name=self.region,
-                    config=self.config,
-                    aws_access_key_id=credentials["AccessKeyId"],
-                    aws_secret_access_key=credentials["SecretAccessKey"],
-                    aws_session_token=credentials["SessionToken"],
-                )
-        else:
-            # Use default credentials
-            return self.session.client(
-                service_name,
-                region_name=self.region,
-                config=self.config,
-            )
+
+            credentials = response["Credentials"]
+            _STS_CREDENTIALS[key] = credentials
+            return credentials
 
     async def verify_role_access(
         self,
@@ -115,14 +176,7 @@ class AWSBaseService:
 
     def parse_arn(self, arn: str) -> dict[str, str]:
         """Parse an ARN into its components."""
-        parts = arn.split(":")
-        return {
-            "partition": parts[1] if len(parts) > 1 else "",
-            "service": parts[2] if len(parts) > 2 else "",
-            "region": parts[3] if len(parts) > 3 else "",
-            "account": parts[4] if len(parts) > 4 else "",
-            "resource": ":".join(parts[5:]) if len(parts) > 5 else "",
-        }
+        return _parse_arn(arn)
 
     def get_tag_value(self, tags: list[dict], key: str) -> Optional[str]:
         """Get value from AWS tags list."""
@@ -56,6 +56,18 @@ class EC2Service(AWSBaseService):
                     return self._instance_to_resource(instance)
         return None
 
+    async def get_instances(
+        self, instance_ids: list[str]
+    ) -> list[ResourceResponse]:
+        """Get details for multiple instances in a single describe call."""
+        resources = []
+        async with await self.get_client("ec2") as ec2:
+            response = await ec2.describe_instances(InstanceIds=instance_ids)
+            for reservation in response.get("Reservations", []):
+                for instance in reservation.get("Instances", []):
+                    resources.append(self._instance_to_resource(instance))
+        return resources
+
     async def start_instances(
         self,
         instance_ids: list[str],
@@ -1,5 +1,6 @@
 """Safety controls for destructive operations."""
 
+import asyncio
 from typing import Optional
 
 from fastapi import HTTPException, status
@@ -19,6 +20,10 @@ class SafetyService:
     def __init__(self):
         self.protected_tags = settings.protected_tags
         self.admin_override_code = settings.admin_override_code
+        # In-flight tag lookups keyed by (resource_type, resource_id);
+        # concurrent checks for the same resource share one describe call
+        self._tag_lock = asyncio.Lock()
+        self._tag_futures: dict[tuple[str, str], asyncio.Future] = {}
 
     async def check_production_protection(
         self,
@@ -32,7 +37,7 @@ class SafetyService:
         Raises HTTPException if resource is protected and no valid override.
         """
         # Get resource tags
-        tags = await self._get_resource_tags(resource_type, resource_id)
+        tags = await self._get_resource_tags_deduped(resource_type, resource_id)
 
         # Check for protected environment tags
         env_tag = tags.get("Environment", "").lower()
@@ -54,6 +59,85 @@ class SafetyService:
                     "Provide admin override code to proceed.",
                 )
 
+    async def check_production_protection_bulk(
+        self,
+        resource_type: str,
+        resource_ids: list[str],
+        override_code: Optional[str] = None,
+    ) -> None:
+        """
+        Check protection for a batch of resources in one pass.
+
+        Fetches tags for all resources with a single describe call where
+        the service supports it, then raises one HTTPException listing
+        every protected resource.
+        """
+        if not resource_ids:
+            return
+
+        tags_by_id = await self._get_resource_tags_bulk(resource_type, resource_ids)
+
+        protected = [
+            resource_id
+            for resource_id in resource_ids
+            if self._is_protected(tags_by_id.get(resource_id, {}))
+        ]
+
+        if protected and not self._verify_override(override_code):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Cannot modify protected resources: {', '.join(protected)}. "
+                f"Provide admin override code to proceed.",
+            )
+
+    def _is_protected(self, tags: dict[str, str]) -> bool:
+        """Check if tags mark a resource as protected."""
+        if tags.get("Environment", "").lower() in self.protected_tags:
+            return True
+        return tags.get("Protected", "").lower() in ("true", "yes", "1")
+
+    async def _get_resource_tags_deduped(
+        self, resource_type: str, resource_id: str
+    ) -> dict[str, str]:
+        """Get tags for a resource, coalescing concurrent lookups.
+
+        If a lookup for the same (type, id) is already in flight, await
+        its future instead of issuing another describe call. Futures are
+        dropped on completion, so results are never served stale.
+        """
+        key = (resource_type, resource_id)
+        async with self._tag_lock:
+            future = self._tag_futures.get(key)
+            if future is None:
+                future = asyncio.ensure_future(
+                    self._get_resource_tags(resource_type, resource_id)
+                )
+                future.add_done_callback(
+                    lambda _, key=key: self._tag_futures.pop(key, None)
+                )
+                self._tag_futures[key] = future
+        return await future
+
+    async def _get_resource_tags_bulk(
+        self, resource_type: str, resource_ids: list[str]
+    ) -> dict[str, dict[str, str]]:
+        """Get tags for a batch of resources."""
+        try:
+            if resource_type == "ec2":
+                service = EC2Service()
+                instances = await service.get_instances(resource_ids)
+                return {i.resource_id: i.tags for i in instances}
+
+            # No batch API for this type; fall back to per-resource lookups
+            return {
+                resource_id: await self._get_resource_tags(resource_type, resource_id)
+                for resource_id in resource_ids
+            }
+
+        except Exception:
+            # If we can't get tags, allow the operation but log warning
+            return {}
+
     async def _get_resource_tags(
         self, resource_type: str, resource_id: str
     ) -> dict[str, str]:
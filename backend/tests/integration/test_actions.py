@@ -1,63 +1,125 @@
 """Integration tests for actions endpoints."""
 
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock
 from httpx import AsyncClient
 
+from app.main import app
+from app.dependencies import (
+    get_audit_service,
+    get_ec2_service,
+    get_ecs_service,
+    get_rds_service,
+    get_s3_service,
+    get_safety_service,
+)
+
+
+@pytest.fixture
+def mock_audit():
+    """Override the audit service with a mock."""
+    mock = AsyncMock()
+    # enqueue_action is synchronous on the real service
+    mock.enqueue_action = Mock()
+    app.dependency_overrides[get_audit_service] = lambda: mock
+    return mock
+
+
+@pytest.fixture
+def mock_safety():
+    """Override the safety service with a mock."""
+    mock = AsyncMock()
+    app.dependency_overrides[get_safety_service] = lambda: mock
+    return mock
+
+
+@pytest.fixture
+def mock_ec2_service():
+    """Override the EC2 service with a mock."""
+    mock = AsyncMock()
+    app.dependency_overrides[get_ec2_service] = lambda: mock
+    return mock
+
+
+@pytest.fixture
+def mock_rds_service():
+    """Override the RDS service with a mock."""
+    mock = AsyncMock()
+    app.dependency_overrides[get_rds_service] = lambda: mock
+    return mock
+
+
+@pytest.fixture
+def mock_ecs_service():
+    """Override the ECS service with a mock."""
+    mock = AsyncMock()
+    app.dependency_overrides[get_ecs_service] = lambda: mock
+    return mock
+
+
+@pytest.fixture
+def mock_s3_service():
+    """Override the S3 service with a mock."""
+    mock = AsyncMock()
+    app.dependency_overrides[get_s3_service] = lambda: mock
+    return mock
+
 
 @pytest.mark.asyncio
-async def test_ec2_start_dry_run(client: AsyncClient):
+async def test_ec2_start_dry_run(client: AsyncClient, mock_ec2_service, mock_audit):
     """Test EC2 start action with dry run."""
-    with patch("app.api.routes.actions.EC2Service") as mock_ec2_class:
-        mock_ec2 = AsyncMock()
-        mock_ec2.start_instances.return_value = {
-            "would_start": ["i-1234567890"],
-            "dry_run": True,
-        }
-        mock_ec2_class.return_value = mock_ec2
+    mock_ec2_service.start_instances.return_value = {
+        "would_start": ["i-1234567890"],
+        "dry_run": True,
+    }
 
-        with patch("app.api.routes.actions.AuditService") as mock_audit_class:
-            mock_audit = AsyncMock()
-            mock_audit_class.return_value = mock_audit
-
-            response = await client.post(
-                "/api/actions/ec2/start",
-                json={"resource_ids": ["i-1234567890"], "dry_run": True},
-            )
+    response = await client.post(
+        "/api/actions/ec2/start",
+        json={"resource_ids": ["i-1234567890"], "dry_run": True},
+    )
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "dry_run"
-            assert data["dry_run"] is True
+    # Dry runs are acknowledged with 202: accepted, nothing changed
+    assert response.status_code == 202
+    data = response.json()
+    assert data["status"] == "dry_run"
+    assert data["dry_run"] is True
 
 
 @pytest.mark.asyncio
-async def test_ec2_stop_with_protection_check(client: AsyncClient):
+async def test_ec2_stop_with_protection_check(
+    client: AsyncClient, mock_safety, mock_ec2_service, mock_audit
+):
     """Test EC2 stop action triggers protection check."""
-    with patch("app.api.routes.actions.SafetyService") as mock_safety_class:
-        mock_safety = AsyncMock()
-        mock_safety_class.return_value = mock_safety
+    mock_ec2_service.stop_instances.return_value = {
+        "stopped": ["i-1234567890"],
+    }
 
-        with patch("app.api.routes.actions.EC2Service") as mock_ec2_class:
-            mock_ec2 = AsyncMock()
-            mock_ec2.stop_instances.return_value = {
-                "would_stop": ["i-1234567890"],
-                "dry_run": True,
-            }
-            mock_ec2_class.return_value = mock_ec2
+    response = await client.post(
+        "/api/actions/ec2/stop",
+        json={"resource_ids": ["i-1234567890"], "dry_run": False},
+    )
+
+    assert response.status_code == 200
+    # Verify protection check was called
+    mock_safety.check_production_protection_bulk.assert_called()
 
-            with patch("app.api.routes.actions.AuditService") as mock_audit_class:
-                mock_audit = AsyncMock()
-                mock_audit_class.return_value = mock_audit
 
-                response = await client.post(
-                    "/api/actions/ec2/stop",
-                    json={"resource_ids": ["i-1234567890"], "dry_run": True},
-                )
+@pytest.mark.asyncio
+async def test_ec2_stop_dry_run_skips_remote_checks(
+    client: AsyncClient, mock_safety, mock_ec2_service, mock_audit
+):
+    """Test dry-run without override answers locally, skipping AWS calls."""
+    response = await client.post(
+        "/api/actions/ec2/stop",
+        json={"resource_ids": ["i-1234567890"], "dry_run": True},
+    )
 
-                assert response.status_code == 200
-                # Verify protection check was called
-                mock_safety.check_production_protection.assert_called()
+    assert response.status_code == 202
+    data = response.json()
+    assert data["status"] == "dry_run"
+    assert data["details"]["skipped_remote"] is True
+    mock_safety.check_production_protection_bulk.assert_not_called()
+    mock_ec2_service.stop_instances.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -72,202 +134,156 @@ async def test_ec2_terminate_requires_admin(readonly_client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_ecs_scale_action(client: AsyncClient):
+async def test_ecs_scale_action(
+    client: AsyncClient, mock_safety, mock_ecs_service, mock_audit
+):
     """Test ECS scale action."""
-    with patch("app.api.routes.actions.SafetyService") as mock_safety_class:
-        mock_safety = AsyncMock()
-        mock_safety_class.return_value = mock_safety
-
-        with patch("app.api.routes.actions.ECSService") as mock_ecs_class:
-            mock_ecs = AsyncMock()
-            mock_ecs.scale_service.return_value = {
-                "would_scale": "cluster/service",
-                "current_count": 2,
-                "desired_count": 4,
-                "dry_run": True,
-            }
-            mock_ecs_class.return_value = mock_ecs
-
-            with patch("app.api.routes.actions.AuditService") as mock_audit_class:
-                mock_audit = AsyncMock()
-                mock_audit_class.return_value = mock_audit
-
-                response = await client.put(
-                    "/api/actions/ecs/scale",
-                    json={
-                        "resource_ids": ["cluster/service"],
-                        "cluster": "cluster",
-                        "service": "service",
-                        "desired_count": 4,
-                        "dry_run": True,
-                    },
-                )
-
-                assert response.status_code == 200
-                data = response.json()
-                assert data["status"] == "dry_run"
-                assert data["action"] == "scale"
+    mock_ecs_service.scale_service.return_value = {
+        "would_scale": "cluster/service",
+        "current_count": 2,
+        "desired_count": 4,
+        "dry_run": True,
+    }
+
+    response = await client.put(
+        "/api/actions/ecs/scale",
+        json={
+            "resource_ids": ["cluster/service"],
+            "cluster": "cluster",
+            "service": "service",
+            "desired_count": 4,
+            "dry_run": True,
+        },
+    )
+
+    assert response.status_code == 202
+    data = response.json()
+    assert data["status"] == "dry_run"
+    assert data["action"] == "scale"
 
 
 # Tests for failed operation audit logging (Issue #1)
 @pytest.mark.asyncio
-async def test_ec2_start_failed_logs_audit(client: AsyncClient):
+async def test_ec2_start_failed_logs_audit(
+    client: AsyncClient, mock_ec2_service, mock_audit
+):
     """Test that failed EC2 operations are still logged to audit."""
-    with patch("app.api.routes.actions.EC2Service") as mock_ec2_class:
-        mock_ec2 = AsyncMock()
-        mock_ec2.start_instances.side_effect = Exception("AWS Error: Instance not found")
-        mock_ec2_class.return_value = mock_ec2
-
-        with patch("app.api.routes.actions.AuditService") as mock_audit_class:
-            mock_audit = AsyncMock()
-            mock_audit_class.return_value = mock_audit
+    mock_ec2_service.start_instances.side_effect = Exception(
+        "AWS Error: Instance not found"
+    )
 
-            response = await client.post(
-                "/api/actions/ec2/start",
-                json={"resource_ids": ["i-invalid"], "dry_run": False},
-            )
+    response = await client.post(
+        "/api/actions/ec2/start",
+        json={"resource_ids": ["i-invalid"], "dry_run": False},
+    )
 
-            # Request should fail
-            assert response.status_code == 500
+    # Request should fail
+    assert response.status_code == 500
 
-            # But audit log should still be called with failed status
-            mock_audit.log_action.assert_called_once()
-            call_kwargs = mock_audit.log_action.call_args.kwargs
-            assert call_kwargs["status"] == "failed"
-            assert call_kwargs["action"] == "ec2:start"
-            assert "error" in call_kwargs["response_data"]
-            assert "AWS Error" in call_kwargs["response_data"]["error"]
+    # But audit log should still be called with failed status
+    mock_audit.enqueue_action.assert_called_once()
+    call_kwargs = mock_audit.enqueue_action.call_args.kwargs
+    assert call_kwargs["status"] == "failed"
+    assert call_kwargs["action"] == "ec2:start"
+    # Exception formatting is deferred to the audit flusher
+    assert "AWS Error" in str(call_kwargs["response_data"]["exc"])
 
 
 @pytest.mark.asyncio
-async def test_rds_stop_failed_logs_audit(client: AsyncClient):
+async def test_rds_stop_failed_logs_audit(
+    client: AsyncClient, mock_safety, mock_rds_service, mock_audit
+):
     """Test that failed RDS operations are still logged to audit."""
-    with patch("app.api.routes.actions.SafetyService") as mock_safety_class:
-        mock_safety = AsyncMock()
-        mock_safety_class.return_value = mock_safety
-
-        with patch("app.api.routes.actions.RDSService") as mock_rds_class:
-            mock_rds = AsyncMock()
-            mock_rds.stop_instance.side_effect = Exception("RDS Error: DB instance not found")
-            mock_rds_class.return_value = mock_rds
-
-            with patch("app.api.routes.actions.AuditService") as mock_audit_class:
-                mock_audit = AsyncMock()
-                mock_audit_class.return_value = mock_audit
-
-                response = await client.post(
-                    "/api/actions/rds/stop",
-                    json={
-                        "resource_ids": ["invalid-db"],
-                        "db_instance_identifier": "invalid-db",
-                        "dry_run": False,
-                    },
-                )
-
-                # Request should fail
-                assert response.status_code == 500
-
-                # But audit log should still be called with failed status
-                mock_audit.log_action.assert_called_once()
-                call_kwargs = mock_audit.log_action.call_args.kwargs
-                assert call_kwargs["status"] == "failed"
-                assert call_kwargs["action"] == "rds:stop"
-                assert "error" in call_kwargs["response_data"]
+    mock_rds_service.stop_instance.side_effect = Exception(
+        "RDS Error: DB instance not found"
+    )
 
+    response = await client.post(
+        "/api/actions/rds/stop",
+        json={
+            "resource_ids": ["invalid-db"],
+            "db_instance_identifier": "invalid-db",
+            "dry_run": False,
+        },
+    )
 
-# Tests for override code capture in audit logs (Issue #4)
-@pytest.mark.asyncio
-async def test_ec2_stop_with_override_logs_override_used(client: AsyncClient):
-    """Test that using override code is captured in audit log."""
-    with patch("app.api.routes.actions.SafetyService") as mock_safety_class:
-        mock_safety = AsyncMock()
-        mock_safety_class.return_value = mock_safety
+    # Request should fail
+    assert response.status_code == 500
 
-        with patch("app.api.routes.actions.EC2Service") as mock_ec2_class:
-            mock_ec2 = AsyncMock()
-            mock_ec2.stop_instances.return_value = {"stopped": ["i-prod123"]}
-            mock_ec2_class.return_value = mock_ec2
+    # But audit log should still be called with failed status
+    mock_audit.enqueue_action.assert_called_once()
+    call_kwargs = mock_audit.enqueue_action.call_args.kwargs
+    assert call_kwargs["status"] == "failed"
+    assert call_kwargs["action"] == "rds:stop"
+    assert "exc" in call_kwargs["response_data"]
 
-            with patch("app.api.routes.actions.AuditService") as mock_audit_class:
-                mock_audit = AsyncMock()
-                mock_audit_class.return_value = mock_audit
 
-                response = await client.post(
-                    "/api/actions/ec2/stop",
-                    json={
-                        "resource_ids": ["i-prod123"],
-                        "dry_run": False,
-                        "override_code": "ADMIN-OVERRIDE-123",
-                    },
-                )
+# Tests for override code capture in audit logs (Issue #4)
+@pytest.mark.asyncio
+async def test_ec2_stop_with_override_logs_override_used(
+    client: AsyncClient, mock_safety, mock_ec2_service, mock_audit
+):
+    """Test that using override code is captured in audit log."""
+    mock_ec2_service.stop_instances.return_value = {"stopped": ["i-prod123"]}
+
+    response = await client.post(
+        "/api/actions/ec2/stop",
+        json={
+            "resource_ids": ["i-prod123"],
+            "dry_run": False,
+            "override_code": "ADMIN-OVERRIDE-123",
+        },
+    )
 
-                assert response.status_code == 200
+    assert response.status_code == 200
 
-                # Verify audit log includes override_used flag
-                mock_audit.log_action.assert_called_once()
-                call_kwargs = mock_audit.log_action.call_args.kwargs
-                assert call_kwargs["request_data"]["override_used"] is True
+    # Verify audit log includes override_used flag
+    mock_audit.enqueue_action.assert_called_once()
+    call_kwargs = mock_audit.enqueue_action.call_args.kwargs
+    assert call_kwargs["request_data"]["override_used"] is True
 
 
 @pytest.mark.asyncio
-async def test_ec2_stop_without_override_no_flag(client: AsyncClient):
+async def test_ec2_stop_without_override_no_flag(
+    client: AsyncClient, mock_safety, mock_ec2_service, mock_audit
+):
     """Test that without override code, override_used flag is not set."""
-    with patch("app.api.routes.actions.SafetyService") as mock_safety_class:
-        mock_safety = AsyncMock()
-        mock_safety_class.return_value = mock_safety
-
-        with patch("app.api.routes.actions.EC2Service") as mock_ec2_class:
-            mock_ec2 = AsyncMock()
-            mock_ec2.stop_instances.return_value = {"stopped": ["i-123"]}
-            mock_ec2_class.return_value = mock_ec2
-
-            with patch("app.api.routes.actions.AuditService") as mock_audit_class:
-                mock_audit = AsyncMock()
-                mock_audit_class.return_value = mock_audit
-
-                response = await client.post(
-                    "/api/actions/ec2/stop",
-                    json={
-                        "resource_ids": ["i-123"],
-                        "dry_run": False,
-                    },
-                )
+    mock_ec2_service.stop_instances.return_value = {"stopped": ["i-123"]}
+
+    response = await client.post(
+        "/api/actions/ec2/stop",
+        json={
+            "resource_ids": ["i-123"],
+            "dry_run": False,
+        },
+    )
 
-                assert response.status_code == 200
+    assert response.status_code == 200
 
-                # Verify audit log does not include override_used flag
-                mock_audit.log_action.assert_called_once()
-                call_kwargs = mock_audit.log_action.call_args.kwargs
-                assert "override_used" not in call_kwargs["request_data"]
+    # Verify audit log does not include override_used flag
+    mock_audit.enqueue_action.assert_called_once()
+    call_kwargs = mock_audit.enqueue_action.call_args.kwargs
+    assert "override_used" not in call_kwargs["request_data"]
 
 
 @pytest.mark.asyncio
-async def test_s3_delete_with_override_logs_override_used(client: AsyncClient):
+async def test_s3_delete_with_override_logs_override_used(
+    client: AsyncClient, mock_safety, mock_s3_service, mock_audit
+):
     """Test that S3 delete with override code is captured in audit log."""
-    with patch("app.api.routes.actions.SafetyService") as mock_safety_class:
-        mock_safety = AsyncMock()
-        mock_safety_class.return_value = mock_safety
-
-        with patch("app.api.routes.actions.S3Service") as mock_s3_class:
-            mock_s3 = AsyncMock()
-            mock_s3.delete_bucket.return_value = {"deleted": "prod-bucket"}
-            mock_s3_class.return_value = mock_s3
-
-            with patch("app.api.routes.actions.AuditService") as mock_audit_class:
-                mock_audit = AsyncMock()
-                mock_audit_class.return_value = mock_audit
-
-                response = await client.delete(
-                    "/api/actions/s3/prod-bucket",
-                    params={
-                        "dry_run": "false",
-                        "override_code": "ADMIN-OVERRIDE-456",
-                    },
-                )
-
-                assert response.status_code == 200
-
-                # Verify audit log includes override_used flag
-                mock_audit.log_action.assert_called_once()
-                call_kwargs = mock_audit.log_action.call_args.kwargs
-                assert call_kwargs["request_data"]["override_used"] is True
+    mock_s3_service.delete_bucket.return_value = {"deleted": "prod-bucket"}
+
+    response = await client.delete(
+        "/api/actions/s3/prod-bucket",
+        params={
+            "dry_run": "false",
+            "override_code": "ADMIN-OVERRIDE-456",
+        },
+    )
+
+    assert response.status_code == 200
+
+    # Verify audit log includes override_used flag
+    mock_audit.enqueue_action.assert_called_once()
+    call_kwargs = mock_audit.enqueue_action.call_args.kwargs
+    assert call_kwargs["request_data"]["override_used"] is True
@@ -1,8 +1,11 @@
 """Integration tests for audit endpoints."""
 
+import csv
+import io
+
 import pytest
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.models.database import AuditLog, User
 
@@ -64,3 +67,76 @@ async def test_list_audit_logs_requires_admin(readonly_client: AsyncClient):
     response = await readonly_client.get("/api/audit")
 
     assert response.status_code == 403
+
+
+@pytest.fixture
+def export_session_maker(db_engine, monkeypatch):
+    """Point the export stream generators at the test database.
+
+    The generators open their own session from async_session_maker
+    (the request-scoped session is gone by the time the body streams),
+    so the get_db override does not reach them.
+    """
+    session_maker = async_sessionmaker(
+        db_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    monkeypatch.setattr(
+        "app.api.routes.audit.async_session_maker", session_maker
+    )
+    return session_maker
+
+
+async def _create_audit_logs(db_session: AsyncSession, test_user: User, count: int):
+    """Insert a batch of audit logs for export tests."""
+    for i in range(count):
+        log = AuditLog(
+            user_id=test_user.id,
+            action="ec2:stop",
+            resource_type="ec2",
+            resource_id=f"i-{i}",
+            status="success",
+        )
+        db_session.add(log)
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_export_audit_logs_json(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    export_session_maker,
+):
+    """Test streaming the audit log export as JSON."""
+    await _create_audit_logs(db_session, test_user, 3)
+
+    response = await client.get("/api/audit/export?format=json")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/json")
+    rows = response.json()
+    assert len(rows) == 3
+    assert rows[0]["action"] == "ec2:stop"
+    assert rows[0]["user_email"] == test_user.email
+
+
+@pytest.mark.asyncio
+async def test_export_audit_logs_csv(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    export_session_maker,
+):
+    """Test streaming the audit log export as CSV."""
+    await _create_audit_logs(db_session, test_user, 3)
+
+    response = await client.get("/api/audit/export?format=csv")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 3
+    assert rows[0]["action"] == "ec2:stop"
+    assert rows[0]["user_email"] == test_user.email
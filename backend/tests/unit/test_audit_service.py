@@ -0,0 +1,36 @@
+"""Tests for audit service filtering."""
+
+import pytest
+
+from app.services import audit as audit_module
+from app.services.audit import AuditService
+
+
+@pytest.fixture
+def audit_service():
+    """Create audit service instance."""
+    return AuditService()
+
+
+class TestAuditLevel:
+    """Tests for the AUDIT_LEVEL row filter."""
+
+    def test_all_records_everything(self, audit_service, monkeypatch):
+        """Default level keeps every status."""
+        monkeypatch.setattr(audit_module.settings, "audit_level", "all")
+        for status in ("success", "failed", "dry_run"):
+            assert audit_service._should_record(status) is True
+
+    def test_writes_only_skips_dry_runs(self, audit_service, monkeypatch):
+        """writes_only drops dry-run rows but keeps real mutations."""
+        monkeypatch.setattr(audit_module.settings, "audit_level", "writes_only")
+        assert audit_service._should_record("dry_run") is False
+        assert audit_service._should_record("success") is True
+        assert audit_service._should_record("failed") is True
+
+    def test_failures_only_keeps_failures(self, audit_service, monkeypatch):
+        """failures_only records failed actions exclusively."""
+        monkeypatch.setattr(audit_module.settings, "audit_level", "failures_only")
+        assert audit_service._should_record("failed") is True
+        assert audit_service._should_record("success") is False
+        assert audit_service._should_record("dry_run") is False